@@ -1,7 +1,49 @@
 """
 Shared MCP instance for all tools.
 """
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastmcp import FastMCP
 
+from src.graphql_executor import cleanup, get_graphql_client, warm_up_connection
+from utils.team_resolver import keep_team_index_fresh
+
+# Lifespans may be entered once per session (HTTP transports), so the shared
+# HTTP client is only closed once the last active session has ended.
+_active_sessions = 0
+
+# Background startup work (connection warm-up, team index refresh), kept
+# referenced while it runs and cancelled when the last session ends
+_background_tasks = []
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Create the shared GraphQL HTTP client up front and release it when the server shuts down."""
+    global _active_sessions
+    _active_sessions += 1
+    if _active_sessions == 1:
+        try:
+            await get_graphql_client()
+        except ValueError:
+            # Missing API key; tools report it when they are called
+            pass
+        else:
+            # Connect and load the team index in the background so startup
+            # isn't held up by the handshake
+            _background_tasks.append(asyncio.ensure_future(warm_up_connection()))
+            _background_tasks.append(asyncio.ensure_future(keep_team_index_fresh()))
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            for task in _background_tasks:
+                task.cancel()
+            _background_tasks.clear()
+            await cleanup()
+
+
 # Single global MCP instance  
-mcp = FastMCP("NCAA Football GraphQL Server")
\ No newline at end of file
+mcp = FastMCP("NCAA Football GraphQL Server", lifespan=lifespan)
@@ -2,136 +2,10 @@
 Betting-related GraphQL queries for college football data.
 """
 
-GET_BETTING_LINES_WITH_SEASON_WEEK_QUERY = """
-query GetBettingLines($season: smallint!, $week: smallint!, $limit: Int) {
+GET_BETTING_LINES_QUERY = """
+query GetBettingLines($where: gameBoolExp!, $limit: Int) {
     game(
-        where: {
-            season: { _eq: $season }
-            week: { _eq: $week }
-            lines: {}
-        }
-        orderBy: [
-            { excitement: DESC_NULLS_LAST }
-            { conferenceGame: DESC }
-            { startDate: DESC }
-        ]
-        limit: $limit
-    ) {
-        id
-        season
-        week
-        startDate
-        status
-        homeTeam
-        awayTeam
-        homePoints
-        awayPoints
-        excitement
-        conferenceGame
-        neutralSite
-        
-        # ELO Ratings
-        awayStartElo
-        homeStartElo
-        awayEndElo
-        homeEndElo
-        
-        # Win Probabilities
-        awayPostgameWinProb
-        homePostgameWinProb
-        
-        homeTeamInfo {
-            teamId
-            school
-            conference
-        }
-        
-        awayTeamInfo {
-            teamId
-            school
-            conference
-        }
-        
-        lines {
-            spread
-            spreadOpen
-            overUnder
-            overUnderOpen
-            moneylineHome
-            moneylineAway
-        }
-    }
-}
-"""
-
-GET_BETTING_LINES_WITH_SEASON_QUERY = """
-query GetBettingLines($season: smallint!, $limit: Int) {
-    game(
-        where: {
-            season: { _eq: $season }
-            lines: {}
-        }
-        orderBy: [
-            { excitement: DESC_NULLS_LAST }
-            { conferenceGame: DESC }
-            { startDate: DESC }
-        ]
-        limit: $limit
-    ) {
-        id
-        season
-        week
-        startDate
-        status
-        homeTeam
-        awayTeam
-        homePoints
-        awayPoints
-        excitement
-        conferenceGame
-        neutralSite
-        
-        # ELO Ratings
-        awayStartElo
-        homeStartElo
-        awayEndElo
-        homeEndElo
-        
-        # Win Probabilities
-        awayPostgameWinProb
-        homePostgameWinProb
-        
-        homeTeamInfo {
-            teamId
-            school
-            conference
-        }
-        
-        awayTeamInfo {
-            teamId
-            school
-            conference
-        }
-        
-        lines {
-            spread
-            spreadOpen
-            overUnder
-            overUnderOpen
-            moneylineHome
-            moneylineAway
-        }
-    }
-}
-"""
-
-GET_BETTING_LINES_WITH_WEEK_QUERY = """
-query GetBettingLines($week: smallint!, $limit: Int) {
-    game(
-        where: {
-            week: { _eq: $week }
-            lines: {}
-        }
+        where: $where
         orderBy: [
             { excitement: DESC_NULLS_LAST }
             { conferenceGame: DESC }
@@ -141,6 +15,7 @@ query GetBettingLines($week: smallint!, $limit: Int) {
     ) {
         id
         season
+        seasonType
         week
         startDate
         status
@@ -186,153 +61,23 @@ query GetBettingLines($week: smallint!, $limit: Int) {
 }
 """
 
-GET_BETTING_LINES_WITH_TEAM_QUERY = """
-query GetBettingLines($teamId: Int!, $season: smallint, $limit: Int) {
-    game(
-        where: {
-            _and: [
-                {
-                    _or: [
-                        { homeTeamId: { _eq: $teamId } }
-                        { awayTeamId: { _eq: $teamId } }
-                    ]
-                }
-                { season: { _eq: $season } }
-                { lines: {} }
-            ]
-        }
-        orderBy: [
-            { excitement: DESC_NULLS_LAST }
-            { conferenceGame: DESC }
-            { startDate: DESC }
-        ]
-        limit: $limit
-    ) {
-        id
-        season
-        week
-        startDate
-        status
-        homeTeam
-        awayTeam
-        homePoints
-        awayPoints
-        excitement
-        conferenceGame
-        neutralSite
-        
-        # ELO Ratings
-        awayStartElo
-        homeStartElo
-        awayEndElo
-        homeEndElo
-        
-        # Win Probabilities
-        awayPostgameWinProb
-        homePostgameWinProb
-        
-        homeTeamInfo {
-            teamId
-            school
-            conference
-        }
-        
-        awayTeamInfo {
-            teamId
-            school
-            conference
-        }
-        
-        lines {
-            spread
-            spreadOpen
-            overUnder
-            overUnderOpen
-            moneylineHome
-            moneylineAway
-        }
-    }
-}
-"""
-
-GET_BETTING_LINES_WITH_TEAM_NO_SEASON_QUERY = """
-query GetBettingLines($teamId: Int!, $limit: Int) {
-    game(
-        where: {
-            _and: [
-                {
-                    _or: [
-                        { homeTeamId: { _eq: $teamId } }
-                        { awayTeamId: { _eq: $teamId } }
-                    ]
-                }
-                { lines: {} }
-            ]
-        }
-        orderBy: [
-            { excitement: DESC_NULLS_LAST }
-            { conferenceGame: DESC }
-            { startDate: DESC }
-        ]
-        limit: $limit
-    ) {
-        id
-        season
-        week
-        startDate
-        status
-        homeTeam
-        awayTeam
-        homePoints
-        awayPoints
-        excitement
-        conferenceGame
-        neutralSite
-        
-        # ELO Ratings
-        awayStartElo
-        homeStartElo
-        awayEndElo
-        homeEndElo
-        
-        # Win Probabilities
-        awayPostgameWinProb
-        homePostgameWinProb
-        
-        homeTeamInfo {
-            teamId
-            school
-            conference
-        }
-        
-        awayTeamInfo {
-            teamId
-            school
-            conference
-        }
-        
-        lines {
-            spread
-            spreadOpen
-            overUnder
-            overUnderOpen
-            moneylineHome
-            moneylineAway
-        }
+GET_TEAM_NAME_QUERY = """
+query GetTeamName($teamId: Int!) {
+    currentTeams(where: { teamId: { _eq: $teamId } }) {
+        school
     }
 }
 """
 
-GET_ALL_BETTING_LINES_QUERY = """
-query GetBettingLines($limit: Int) {
+# Slim selection for team-level betting analysis: only the fields the
+# betting analyzers read. Ordered most recent first for trend analysis.
+GET_TEAM_BETTING_RESULTS_QUERY = """
+query GetTeamBettingResults($where: gameBoolExp!, $limit: Int) {
     game(
-        where: {
-            lines: {}
-        }
+        where: $where
         orderBy: [
-            { excitement: DESC_NULLS_LAST }
-            { conferenceGame: DESC }
             { startDate: DESC }
+            { id: ASC }
         ]
         limit: $limit
     ) {
@@ -340,53 +85,25 @@ query GetBettingLines($limit: Int) {
         season
         week
         startDate
-        status
         homeTeam
         awayTeam
         homePoints
         awayPoints
-        excitement
-        conferenceGame
-        neutralSite
-        
-        # ELO Ratings
-        awayStartElo
-        homeStartElo
-        awayEndElo
-        homeEndElo
-        
-        # Win Probabilities
-        awayPostgameWinProb
-        homePostgameWinProb
         
         homeTeamInfo {
             teamId
             school
-            conference
         }
         
         awayTeamInfo {
             teamId
             school
-            conference
         }
         
         lines {
             spread
-            spreadOpen
             overUnder
-            overUnderOpen
-            moneylineHome
-            moneylineAway
         }
     }
 }
 """
-
-GET_TEAM_NAME_QUERY = """
-query GetTeamName($teamId: Int!) {
-    currentTeams(where: { teamId: { _eq: $teamId } }) {
-        school
-    }
-}
-"""
\ No newline at end of file
@@ -2,507 +2,31 @@
 Game-related GraphQL queries for college football data.
 """
 
-GET_GAMES_WITH_SEASON_WEEK_SEASONTYPE_QUERY = """
-query GetGames(
-    $season: smallint!
-    $week: smallint!
-    $seasonType: season_type!
-    $includeBettingLines: Boolean = false
-    $includeWeather: Boolean = false
-    $includeMedia: Boolean = false
-    $limit: Int
-) {
-    game(
-        where: {
-            season: { _eq: $season }
-            week: { _eq: $week }
-            seasonType: { _eq: $seasonType }
-        }
-        orderBy: [
-            { excitement: DESC_NULLS_LAST }
-            { conferenceGame: DESC }
-            { startDate: ASC }
-        ]
-        limit: $limit
-    ) {
-        id
-        season
-        seasonType
-        week
-        startDate
-        startTimeTbd
-        status
-        neutralSite
-        attendance
-        venueId
-        homePoints
-        awayPoints
-        notes
-        excitement
-        conferenceGame
-        
-        # ELO Ratings
-        awayStartElo
-        homeStartElo
-        awayEndElo
-        homeEndElo
-        
-        # Win Probabilities
-        awayPostgameWinProb
-        homePostgameWinProb
-        
-        # Line Scores (quarter by quarter)
-        awayLineScores
-        homeLineScores
-        
-        homeTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-        
-        awayTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-        
-        weather @include(if: $includeWeather) {
-            condition {
-                id
-                description
-            }
-            temperature
-            dewpoint
-            humidity
-            precipitation
-            pressure
-            snowfall
-            windDirection
-            windGust
-            windSpeed
-            weatherConditionCode
-        }
-        
-        mediaInfo @include(if: $includeMedia) {
-            mediaType
-            name
-        }
-        
-        lines @include(if: $includeBettingLines) {
-            spread
-            spreadOpen
-            moneylineHome
-            moneylineAway
-            overUnder
-            overUnderOpen
-        }
-    }
-}
-"""
-
-GET_GAMES_WITH_SEASON_WEEK_QUERY = """
-query GetGames(
-    $season: smallint!
-    $week: smallint!
-    $includeBettingLines: Boolean = false
-    $includeWeather: Boolean = false
-    $includeMedia: Boolean = false
-    $limit: Int
-) {
-    game(
-        where: {
-            season: { _eq: $season }
-            week: { _eq: $week }
-        }
-        orderBy: [
-            { excitement: DESC_NULLS_LAST }
-            { conferenceGame: DESC }
-            { startDate: ASC }
-        ]
-        limit: $limit
-    ) {
-        id
-        season
-        seasonType
-        week
-        startDate
-        startTimeTbd
-        status
-        neutralSite
-        attendance
-        venueId
-        homePoints
-        awayPoints
-        notes
-        excitement
-        conferenceGame
-        
-        # ELO Ratings
-        awayStartElo
-        homeStartElo
-        awayEndElo
-        homeEndElo
-        
-        # Win Probabilities
-        awayPostgameWinProb
-        homePostgameWinProb
-        
-        # Line Scores (quarter by quarter)
-        awayLineScores
-        homeLineScores
-        
-        homeTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-        
-        awayTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-        
-        weather @include(if: $includeWeather) {
-            condition {
-                id
-                description
-            }
-            temperature
-            dewpoint
-            humidity
-            precipitation
-            pressure
-            snowfall
-            windDirection
-            windGust
-            windSpeed
-            weatherConditionCode
-        }
-        
-        mediaInfo @include(if: $includeMedia) {
-            mediaType
-            name
-        }
-        
-        lines @include(if: $includeBettingLines) {
-            spread
-            spreadOpen
-            moneylineHome
-            moneylineAway
-            overUnder
-            overUnderOpen
-        }
-    }
-}
-"""
-
-GET_GAMES_WITH_SEASON_SEASONTYPE_QUERY = """
-query GetGames(
-    $season: smallint!
-    $seasonType: season_type!
-    $includeBettingLines: Boolean = false
-    $includeWeather: Boolean = false
-    $includeMedia: Boolean = false
-    $limit: Int
-) {
-    game(
-        where: {
-            season: { _eq: $season }
-            seasonType: { _eq: $seasonType }
-        }
-        orderBy: [
-            { excitement: DESC_NULLS_LAST }
-            { conferenceGame: DESC }
-            { startDate: ASC }
-        ]
-        limit: $limit
-    ) {
-        id
-        season
-        seasonType
-        week
-        startDate
-        startTimeTbd
-        status
-        neutralSite
-        attendance
-        venueId
-        homePoints
-        awayPoints
-        notes
-        excitement
-        conferenceGame
-        
-        # ELO Ratings
-        awayStartElo
-        homeStartElo
-        awayEndElo
-        homeEndElo
-        
-        # Win Probabilities
-        awayPostgameWinProb
-        homePostgameWinProb
-        
-        # Line Scores (quarter by quarter)
-        awayLineScores
-        homeLineScores
-        
-        homeTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-        
-        awayTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-        
-        weather @include(if: $includeWeather) {
-            condition {
-                id
-                description
-            }
-            temperature
-            dewpoint
-            humidity
-            precipitation
-            pressure
-            snowfall
-            windDirection
-            windGust
-            windSpeed
-            weatherConditionCode
-        }
-        
-        mediaInfo @include(if: $includeMedia) {
-            mediaType
-            name
-        }
-        
-        lines @include(if: $includeBettingLines) {
-            spread
-            spreadOpen
-            moneylineHome
-            moneylineAway
-            overUnder
-            overUnderOpen
-        }
-    }
-}
-"""
-
-GET_GAMES_WITH_SEASON_QUERY = """
-query GetGames(
-    $season: smallint!
-    $includeBettingLines: Boolean = false
-    $includeWeather: Boolean = false
-    $includeMedia: Boolean = false
-    $limit: Int
-) {
-    game(
-        where: {
-            season: { _eq: $season }
-        }
-        orderBy: [
-            { excitement: DESC_NULLS_LAST }
-            { conferenceGame: DESC }
-            { startDate: ASC }
-        ]
-        limit: $limit
-    ) {
-        id
-        season
-        seasonType
-        week
-        startDate
-        startTimeTbd
-        status
-        neutralSite
-        attendance
-        venueId
-        homePoints
-        awayPoints
-        notes
-        excitement
-        conferenceGame
-        
-        # ELO Ratings
-        awayStartElo
-        homeStartElo
-        awayEndElo
-        homeEndElo
-        
-        # Win Probabilities
-        awayPostgameWinProb
-        homePostgameWinProb
-        
-        # Line Scores (quarter by quarter)
-        awayLineScores
-        homeLineScores
-        
-        homeTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-        
-        awayTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-        
-        weather @include(if: $includeWeather) {
-            condition {
-                id
-                description
-            }
-            temperature
-            dewpoint
-            humidity
-            precipitation
-            pressure
-            snowfall
-            windDirection
-            windGust
-            windSpeed
-            weatherConditionCode
-        }
-        
-        mediaInfo @include(if: $includeMedia) {
-            mediaType
-            name
-        }
-        
-        lines @include(if: $includeBettingLines) {
-            spread
-            spreadOpen
-            moneylineHome
-            moneylineAway
-            overUnder
-            overUnderOpen
-        }
-    }
-}
-"""
-
-GET_GAMES_WITH_WEEK_QUERY = """
-query GetGames(
-    $week: smallint!
-    $includeBettingLines: Boolean = false
-    $includeWeather: Boolean = false
-    $includeMedia: Boolean = false
-    $limit: Int
-) {
-    game(
-        where: {
-            week: { _eq: $week }
-        }
-        orderBy: [
-            { excitement: DESC_NULLS_LAST }
-            { conferenceGame: DESC }
-            { startDate: ASC }
-        ]
-        limit: $limit
-    ) {
-        id
-        season
-        seasonType
-        week
-        startDate
-        startTimeTbd
-        status
-        neutralSite
-        attendance
-        venueId
-        homePoints
-        awayPoints
-        notes
-        excitement
-        conferenceGame
-        
-        # ELO Ratings
-        awayStartElo
-        homeStartElo
-        awayEndElo
-        homeEndElo
-        
-        # Win Probabilities
-        awayPostgameWinProb
-        homePostgameWinProb
-        
-        # Line Scores (quarter by quarter)
-        awayLineScores
-        homeLineScores
-        
-        homeTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-        
-        awayTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-        
-        weather @include(if: $includeWeather) {
-            condition {
-                id
-                description
-            }
-            temperature
-            dewpoint
-            humidity
-            precipitation
-            pressure
-            snowfall
-            windDirection
-            windGust
-            windSpeed
-            weatherConditionCode
-        }
-        
-        mediaInfo @include(if: $includeMedia) {
-            mediaType
-            name
-        }
-        
-        lines @include(if: $includeBettingLines) {
-            spread
-            spreadOpen
-            moneylineHome
-            moneylineAway
-            overUnder
-            overUnderOpen
-        }
-    }
+# Team fields selected for both sides of every game
+TEAM_CORE_FRAGMENT = """
+fragment TeamCore on currentTeams {
+    teamId
+    school
+    abbreviation
+    conference
 }
 """
 
-GET_ALL_GAMES_QUERY = """
+# Filters on any combination of season, week, and seasonType are passed in
+# the `where` variable, so every filter shape (including GetGamesByWeek's)
+# shares one document.
+# $includeDetails: false trims the response to a scoreboard-style summary.
+GET_GAMES_QUERY = """
 query GetGames(
+    $where: gameBoolExp!
     $includeBettingLines: Boolean = false
     $includeWeather: Boolean = false
     $includeMedia: Boolean = false
+    $includeDetails: Boolean = true
     $limit: Int
 ) {
     game(
+        where: $where
         orderBy: [
             { excitement: DESC_NULLS_LAST }
             { conferenceGame: DESC }
@@ -515,14 +39,14 @@ query GetGames(
         seasonType
         week
         startDate
-        startTimeTbd
+        startTimeTbd @include(if: $includeDetails)
         status
         neutralSite
-        attendance
-        venueId
+        attendance @include(if: $includeDetails)
+        venueId @include(if: $includeDetails)
         homePoints
         awayPoints
-        notes
+        notes @include(if: $includeDetails)
         excitement
         conferenceGame
         
@@ -541,17 +65,13 @@ query GetGames(
         homeLineScores
         
         homeTeamInfo {
-            teamId
             school
-            abbreviation
-            conference
+            ...TeamCore @include(if: $includeDetails)
         }
         
         awayTeamInfo {
-            teamId
             school
-            abbreviation
-            conference
+            ...TeamCore @include(if: $includeDetails)
         }
         
         weather @include(if: $includeWeather) {
@@ -586,148 +106,17 @@ query GetGames(
         }
     }
 }
-"""
-
-GET_GAMES_BY_WEEK_QUERY = """
-query GetGamesByWeek(
-    $season: smallint!
-    $week: smallint!
-    $limit: Int
-) {
-    game(
-        where: {
-            season: { _eq: $season }
-            week: { _eq: $week }
-        }
-        orderBy: [
-            { excitement: DESC_NULLS_LAST }
-            { conferenceGame: DESC }
-            { startDate: ASC }
-        ]
-        limit: $limit
-    ) {
-        id
-        season
-        seasonType
-        week
-        startDate
-        startTimeTbd
-        status
-        neutralSite
-        attendance
-        homePoints
-        awayPoints
-        excitement
-        conferenceGame
-        
-        # ELO Ratings
-        awayStartElo
-        homeStartElo
-        awayEndElo
-        homeEndElo
-        
-        # Win Probabilities
-        awayPostgameWinProb
-        homePostgameWinProb
-        
-        # Line Scores (quarter by quarter)
-        awayLineScores
-        homeLineScores
-        
-        homeTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-        
-        awayTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-    }
-}
-"""
-
-GET_TEAM_GAMES_WITH_SEASON_QUERY = """
-query GetTeamGames(
-    $teamId: Int!
-    $season: smallint!
-    $limit: Int
-) {
-    game(
-        where: {
-            season: { _eq: $season }
-            _or: [
-                { homeTeamId: { _eq: $teamId } }
-                { awayTeamId: { _eq: $teamId } }
-            ]
-        }
-        orderBy: [
-            { excitement: DESC_NULLS_LAST }
-            { startDate: ASC }
-        ]
-        limit: $limit
-    ) {
-        id
-        season
-        seasonType
-        week
-        startDate
-        startTimeTbd
-        status
-        neutralSite
-        attendance
-        homePoints
-        awayPoints
-        excitement
-        conferenceGame
-        
-        # ELO Ratings
-        awayStartElo
-        homeStartElo
-        awayEndElo
-        homeEndElo
-        
-        # Win Probabilities
-        awayPostgameWinProb
-        homePostgameWinProb
-        
-        # Line Scores (quarter by quarter)
-        awayLineScores
-        homeLineScores
-        
-        homeTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-        
-        awayTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
-        }
-    }
-}
-"""
+""" + TEAM_CORE_FRAGMENT
 
+# The `where` variable carries the team's home/away `_or` plus any season
+# and seasonType filters, so optional filters are applied server-side
 GET_TEAM_GAMES_QUERY = """
 query GetTeamGames(
-    $teamId: Int!
+    $where: gameBoolExp!
     $limit: Int
 ) {
     game(
-        where: {
-            _or: [
-                { homeTeamId: { _eq: $teamId } }
-                { awayTeamId: { _eq: $teamId } }
-            ]
-        }
+        where: $where
         orderBy: [
             { excitement: DESC_NULLS_LAST }
             { startDate: ASC }
@@ -763,21 +152,15 @@ query GetTeamGames(
         homeLineScores
         
         homeTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
+            ...TeamCore
         }
         
         awayTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
+            ...TeamCore
         }
     }
 }
-"""
+""" + TEAM_CORE_FRAGMENT
 
 GET_RECENT_GAMES_QUERY = """
 query GetRecentGames($limit: Int) {
@@ -817,18 +200,12 @@ query GetRecentGames($limit: Int) {
         homeLineScores
         
         homeTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
+            ...TeamCore
         }
         
         awayTeamInfo {
-            teamId
-            school
-            abbreviation
-            conference
+            ...TeamCore
         }
     }
 }
-"""
\ No newline at end of file
+""" + TEAM_CORE_FRAGMENT
\ No newline at end of file
@@ -2,6 +2,18 @@
 Rankings-related GraphQL queries for college football data.
 """
 
+GET_LATEST_WEEK_QUERY = """
+query GetLatestWeekForSeason($season: Int!) {
+    poll(
+        where: { season: { _eq: $season } }
+        orderBy: { week: DESC }
+        limit: 1
+    ) {
+        week
+    }
+}
+"""
+
 def build_rankings_query(season: int = None, week: int = None, poll_type: str = None, team: str = None, top_n: int = 25) -> tuple[str, dict]:
     """
     Build dynamic rankings query based on provided parameters.
@@ -9,6 +9,7 @@ A simple GraphQL wrapper for college football data with MCP protocol support.
 import json
 import logging
 import re
+import sys
 from typing import Union, Optional, Dict, Any
 from dotenv import load_dotenv
 
@@ -213,6 +214,15 @@ async def server_cleanup():
 # =============================================================================
 
 if __name__ == "__main__":
+    # Every tool spends its time awaiting the GraphQL endpoint, so run on
+    # uvloop's libuv-based event loop where it is available
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+    
     logger.info("Starting College Football GraphQL MCP Server...")
     try:
         mcp.run()
@@ -3,28 +3,158 @@ GraphQL execution and utilities for the NCAAF MCP Server.
 """
 
 import asyncio
+import hashlib
 import json
+import os
 import time
 import logging
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import httpx
+import orjson
 from fastmcp import Context
 
 from .models import GraphQLError
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of (ETag, response) pairs kept for conditional requests
+_ETAG_CACHE_MAXSIZE = 256
+
+# Check query documents against the bundled schema when tool modules load
+_VALIDATE_QUERIES_ENABLED = os.getenv("CFBD_VALIDATE_QUERIES", "").lower() in ("1", "true", "yes")
+
+_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cfbd-schema.graphql")
+
+
+@lru_cache(maxsize=256)
+def encode_query_prefix(query: str) -> bytes:
+    """
+    Encode the request body up to the variables value.
+    
+    Query documents are module-level constants reused on every call, so
+    each one is escaped and encoded once rather than per request; a body
+    is then this prefix + the encoded variables + b'}'.
+    """
+    return b'{"query":' + orjson.dumps(query) + b',"variables":'
+
+
+def encode_request_body(query: str, variables: Optional[Dict[str, Any]]) -> bytes:
+    """Encode a GraphQL request body, reusing the cached query prefix."""
+    return encode_query_prefix(query) + orjson.dumps(variables or {}) + b'}'
+
+
+@lru_cache(maxsize=256)
+def persisted_query_hash(query: str) -> str:
+    """SHA-256 hex digest identifying a query document for persisted queries."""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def encode_persisted_query_prefix(query: str, include_query: bool) -> bytes:
+    """
+    Encode an automatic persisted query (APQ) request body up to the variables value.
+    
+    The body identifies the document by its SHA-256 hash; the document text
+    itself is only included to register it after the server reports a miss.
+    """
+    query_hash = persisted_query_hash(query)
+    extensions = b'"extensions":{"persistedQuery":{"version":1,"sha256Hash":"' + query_hash.encode() + b'"}}'
+    if include_query:
+        return b'{"query":' + orjson.dumps(query) + b',' + extensions + b',"variables":'
+    return b'{' + extensions + b',"variables":'
+
+
+def precompute_query_encodings(queries: Iterable[str]) -> None:
+    """
+    Encode request prefixes and persisted-query hashes for known documents.
+    
+    Called at tool-module import so the first request for each query does
+    not pay for hashing and escaping its document.
+    """
+    for query in queries:
+        encode_query_prefix(query)
+        encode_persisted_query_prefix(query, False)
+        encode_persisted_query_prefix(query, True)
+
+
+@lru_cache(maxsize=1)
+def _load_schema():
+    """Build the graphql-core schema from the bundled SDL file (once)."""
+    from graphql import build_schema
+    
+    with open(_SCHEMA_PATH, encoding="utf-8") as f:
+        return build_schema(f.read())
+
+
+def validate_query_documents(queries: Iterable[str]) -> List[str]:
+    """
+    Parse and validate query documents against the bundled CFBD schema.
+    
+    Only runs when CFBD_VALIDATE_QUERIES is enabled, so a query that no
+    longer matches the schema is reported once at startup instead of as a
+    GraphQL error on every call. Problems are logged as warnings.
+    
+    Args:
+        queries: GraphQL query strings
+        
+    Returns:
+        Error messages (empty if validation passed or is disabled)
+    """
+    if not _VALIDATE_QUERIES_ENABLED:
+        return []
+    
+    try:
+        from graphql import GraphQLSyntaxError, parse, validate
+        schema = _load_schema()
+    except (ImportError, OSError) as e:
+        logger.warning(f"Skipping query validation: {e}")
+        return []
+    
+    errors = []
+    for query in queries:
+        try:
+            document = parse(query)
+        except GraphQLSyntaxError as e:
+            errors.append(f"{query[:60]}...: {e.message}")
+            continue
+        errors.extend(f"{query[:60]}...: {error.message}" for error in validate(schema, document))
+    
+    for error in errors:
+        logger.warning(f"Query validation failed: {error}")
+    return errors
+
+
+def _persisted_query_error(errors: List[Dict[str, Any]]) -> Optional[str]:
+    """Return the APQ error code (PersistedQueryNotFound/NotSupported) in a response, if any."""
+    for err in errors:
+        code = (err.get("extensions") or {}).get("code", "")
+        message = err.get("message", "")
+        if message == "PersistedQueryNotFound" or code == "PERSISTED_QUERY_NOT_FOUND":
+            return "PersistedQueryNotFound"
+        if message == "PersistedQueryNotSupported" or code == "PERSISTED_QUERY_NOT_SUPPORTED":
+            return "PersistedQueryNotSupported"
+    return None
+
 
 class GraphQLClient:
     """GraphQL client with retry logic and error handling"""
     
     def __init__(self, http_client: httpx.AsyncClient, endpoint: str, headers: Dict[str, str], 
-                 max_retries: int = 3):
+                 max_retries: int = 3, persisted_queries: bool = False,
+                 conditional_requests: bool = False):
         self.http_client = http_client
         self.endpoint = endpoint
         self.headers = headers
         self.max_retries = max_retries
+        self.persisted_queries = persisted_queries
+        self.conditional_requests = conditional_requests
+        # Every request sends the same headers, so merge them once
+        self.request_headers = {"Content-Type": "application/json", **headers}
+        # Request body digest -> (ETag, checked response) for If-None-Match revalidation
+        self._etags: "OrderedDict[bytes, Tuple[str, Any]]" = OrderedDict()
     
     async def execute_query(self, query: str, variables: Dict[str, Any] = None, 
                           ctx: Context = None) -> Dict[str, Any]:
@@ -44,18 +174,110 @@ class GraphQLClient:
         """
         variables = variables or {}
         
-        # Basic query validation
-        if not query.strip():
+        # Basic query validation (isspace avoids copying the document like strip would)
+        if not query or query.isspace():
             raise GraphQLError("Query cannot be empty", query=query)
         
-        # Prepare request
-        payload = {
-            "query": query,
-            "variables": variables
-        }
+        def check_result(result: Dict[str, Any]) -> Dict[str, Any]:
+            # Check for GraphQL errors
+            if result.get("errors"):
+                raise GraphQLError(f"GraphQL errors: {format_graphql_errors(result['errors'])}", query=query)
+            return result
+        
+        if self.persisted_queries:
+            result = await self._execute_persisted(query, variables, ctx, check_result)
+            if result is not None:
+                return result
+        
+        # Prepare request: only the variables need encoding per call
+        body = encode_request_body(query, variables)
+        
+        return await self._post(body, query, ctx, check_result)
+    
+    async def _execute_persisted(self, query: str, variables: Dict[str, Any], ctx: Context,
+                                 check_result: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Execute a query by hash (APQ), registering the document on a miss.
+        
+        Returns:
+            GraphQL response data, or None if the server does not support
+            persisted queries (which also disables them for this client)
+        """
+        apq_error = None
         
-        request_headers = {"Content-Type": "application/json"}
-        request_headers.update(self.headers)
+        def check_persisted(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            nonlocal apq_error
+            if result.get("errors"):
+                apq_error = _persisted_query_error(result["errors"])
+                if apq_error:
+                    return None
+            return check_result(result)
+        
+        encoded_variables = orjson.dumps(variables) + b'}'
+        body = encode_persisted_query_prefix(query, False) + encoded_variables
+        result = await self._post(body, query, ctx, check_persisted)
+        
+        if apq_error == "PersistedQueryNotFound":
+            # First use of this document: send it along with its hash
+            body = encode_persisted_query_prefix(query, True) + encoded_variables
+            return await self._post(body, query, ctx, check_result)
+        if apq_error == "PersistedQueryNotSupported":
+            logger.info("Endpoint does not support persisted queries; sending full documents")
+            self.persisted_queries = False
+            return None
+        return result
+    
+    async def execute_batch(self, operations: List[Tuple[str, Dict[str, Any]]],
+                            ctx: Context = None) -> List[Dict[str, Any]]:
+        """
+        Execute several GraphQL operations in one request (Hasura array batching).
+        
+        Args:
+            operations: List of (query, variables) pairs
+            ctx: MCP context for logging
+            
+        Returns:
+            One GraphQL response per operation, in order. Per-operation
+            GraphQL errors are left in each response for the caller.
+            
+        Raises:
+            GraphQLError: If the batch request itself fails
+        """
+        body = b'[' + b','.join(
+            encode_request_body(query, variables) for query, variables in operations
+        ) + b']'
+        description = f"batch of {len(operations)} operations"
+        
+        def check_results(results: Any) -> List[Dict[str, Any]]:
+            if not isinstance(results, list) or len(results) != len(operations):
+                raise GraphQLError("Batched request returned an unexpected response", query=description)
+            return results
+        
+        return await self._post(body, description, ctx, check_results)
+    
+    async def _post(self, body: bytes, query: str, ctx: Context,
+                    check_result: Callable[[Any], Any]) -> Any:
+        """
+        POST a request body with retry logic, returning the checked JSON response.
+        
+        Args:
+            body: Encoded JSON request body
+            query: Query text (or description) for error context
+            ctx: MCP context for logging
+            check_result: Validates a 200 response, raising GraphQLError to retry
+            
+        Raises:
+            GraphQLError: If all attempts fail
+        """
+        request_headers = self.request_headers
+        
+        # Revalidate a previously seen response instead of downloading it again
+        etag_key = None
+        if self.conditional_requests:
+            etag_key = hashlib.sha256(body).digest()
+            entry = self._etags.get(etag_key)
+            if entry is not None:
+                request_headers = {**request_headers, "If-None-Match": entry[0]}
         
         # Execute with enhanced retry logic
         last_error = None
@@ -66,22 +288,26 @@ class GraphQLClient:
                 
                 response = await self.http_client.post(
                     self.endpoint,
-                    json=payload,
+                    content=body,
                     headers=request_headers
                 )
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = check_result(orjson.loads(response.content))
                     
-                    # Check for GraphQL errors
-                    if result.get("errors"):
-                        error_msg = "; ".join([err.get("message", "Unknown error") for err in result["errors"]])
-                        raise GraphQLError(f"GraphQL errors: {error_msg}", query=query)
+                    if etag_key is not None:
+                        self._remember_etag(etag_key, response.headers.get("ETag"), result)
                     
                     if ctx:
                         await ctx.debug("Query executed successfully")
                     
                     return result
+                elif response.status_code == 304 and etag_key in self._etags:
+                    # Unchanged since the stored response was fetched
+                    self._etags.move_to_end(etag_key)
+                    if ctx:
+                        await ctx.debug("Query result not modified; using stored response")
+                    return self._etags[etag_key][1]
                 else:
                     raise GraphQLError(f"HTTP {response.status_code}: {response.text if hasattr(response, 'text') else 'Unknown error'}", 
                                      query=query, status_code=response.status_code)
@@ -116,6 +342,21 @@ class GraphQLClient:
         if ctx:
             await ctx.error(f"All {self.max_retries} retry attempts failed")
         raise last_error
+    
+    def _remember_etag(self, key: bytes, etag: Optional[str], result: Any) -> None:
+        """Store a response and its ETag for later If-None-Match requests."""
+        if not etag or result is None:
+            self._etags.pop(key, None)
+            return
+        self._etags[key] = (etag, result)
+        self._etags.move_to_end(key)
+        if len(self._etags) > _ETAG_CACHE_MAXSIZE:
+            self._etags.popitem(last=False)
+
+
+def format_graphql_errors(errors: List[Dict[str, Any]]) -> str:
+    """Join GraphQL error messages into one string."""
+    return "; ".join([err.get("message", "Unknown error") for err in errors])
 
 
 def format_graphql_type(type_obj: Dict) -> str:
@@ -0,0 +1,115 @@
+"""
+Request batching for GraphQL queries.
+
+Queries issued within a short window (e.g. an agent calling GetGames,
+GetBettingLines and GetDepthChart back to back) are sent to Hasura as one
+JSON-array batched request instead of separate round trips.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastmcp import Context
+
+from .graphql import GraphQLClient, format_graphql_errors
+from .models import GraphQLError
+
+logger = logging.getLogger(__name__)
+
+_PendingQuery = Tuple[str, Dict[str, Any], Optional[Context], asyncio.Future]
+
+
+class GraphQLBatcher:
+    """Coalesces queries arriving within a short window into batched requests"""
+    
+    def __init__(self, client: GraphQLClient, window: float = 0.01, max_batch_size: int = 20,
+                 max_concurrency: int = 4):
+        self.client = client
+        self.window = window
+        self.max_batch_size = max_batch_size
+        # Bounds simultaneous batch requests so bursts queue here rather
+        # than piling onto the upstream endpoint
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pending: List[_PendingQuery] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+    
+    async def submit(self, query: str, variables: Dict[str, Any] = None,
+                     ctx: Context = None) -> Dict[str, Any]:
+        """
+        Queue a query for the next batch and wait for its result.
+        
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+            ctx: MCP context for logging
+            
+        Returns:
+            GraphQL response data
+            
+        Raises:
+            GraphQLError: If the query (or its batch) fails
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((query, variables or {}, ctx, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        
+        return await future
+    
+    def _flush(self) -> None:
+        """Send everything queued so far."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.ensure_future(self._send(batch))
+    
+    async def _send(self, batch: List[_PendingQuery]) -> None:
+        """Execute a batch once a concurrency slot is free."""
+        async with self._semaphore:
+            await self._execute(batch)
+    
+    async def _execute(self, batch: List[_PendingQuery]) -> None:
+        """Execute a batch and resolve each caller's future."""
+        # A lone query goes out as a normal request
+        if len(batch) == 1:
+            query, variables, ctx, future = batch[0]
+            try:
+                result = await self.client.execute_query(query, variables, ctx)
+            except Exception as e:
+                _resolve(future, error=e)
+            else:
+                _resolve(future, result=result)
+            return
+        
+        operations = [(query, variables) for query, variables, _, _ in batch]
+        try:
+            results = await self.client.execute_batch(operations, batch[0][2])
+        except Exception as e:
+            logger.warning(f"Batched request of {len(batch)} queries failed: {e}")
+            for _, _, _, future in batch:
+                _resolve(future, error=e)
+            return
+        
+        for (query, _, _, future), result in zip(batch, results):
+            if isinstance(result, dict) and result.get("errors"):
+                _resolve(future, error=GraphQLError(f"GraphQL errors: {format_graphql_errors(result['errors'])}", query=query))
+            else:
+                _resolve(future, result=result)
+
+
+def _resolve(future: asyncio.Future, result: Any = None, error: Exception = None) -> None:
+    """Complete a caller's future unless the caller has gone away."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
@@ -2,27 +2,65 @@
 Simple GraphQL execution utilities for MCP tools.
 """
 
-import json
+import asyncio
 import logging
 import os
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, Union
 
 import httpx
+import orjson
 from fastmcp import Context
 
 from .models import GraphQLError
 from .graphql import GraphQLClient
+from .graphql_batcher import GraphQLBatcher
 
 logger = logging.getLogger(__name__)
 
+# Hasura's @cached directive serves repeat queries from its response cache.
+# Only enable it against endpoints that support the directive.
+_HASURA_CACHE_ENABLED = os.getenv("CFBD_HASURA_CACHE", "").lower() in ("1", "true", "yes")
+
+# Batch queries issued within a few milliseconds of each other into one
+# JSON-array request (requires an endpoint with Hasura array batching)
+_BATCHING_ENABLED = os.getenv("CFBD_BATCHING", "").lower() in ("1", "true", "yes")
+_BATCH_WINDOW_MS = float(os.getenv("CFBD_BATCH_WINDOW_MS", "10"))
+_BATCH_MAX_SIZE = int(os.getenv("CFBD_BATCH_MAX_SIZE", "20"))
+_BATCH_CONCURRENCY = int(os.getenv("CFBD_BATCH_CONCURRENCY", "4"))
+
+# Send queries as automatic persisted queries (hash first, full document
+# only on a cache miss); requires an endpoint that supports APQ
+_PERSISTED_QUERIES_ENABLED = os.getenv("CFBD_PERSISTED_QUERIES", "").lower() in ("1", "true", "yes")
+
+# Revalidate repeated queries with If-None-Match so unchanged responses come
+# back as an empty 304 (only useful if the endpoint sends ETags)
+_CONDITIONAL_REQUESTS_ENABLED = os.getenv("CFBD_CONDITIONAL_REQUESTS", "").lower() in ("1", "true", "yes")
+
+# Connection pool size. Keep-alive matches the pool so connections opened
+# during a burst stay warm instead of being closed and re-handshaked.
+_MAX_CONNECTIONS = int(os.getenv("CFBD_MAX_CONNECTIONS", "50"))
+
+# Seconds an idle connection stays open; tool calls arrive in bursts minutes
+# apart, and httpx's 5s default would re-handshake for nearly every burst
+_KEEPALIVE_EXPIRY = float(os.getenv("CFBD_KEEPALIVE_EXPIRY", "300"))
+
+# Trivial query used to open a connection before the first tool call
+_WARM_UP_QUERY = "query WarmUp { __typename }"
+
+# Requests currently in flight, keyed on (query, variables, cache_ttl,
+# return_raw_dict), so identical concurrent calls share one upstream request
+_in_flight: Dict[Tuple[str, bytes, Optional[int], bool], asyncio.Future] = {}
+
 # Simple global HTTP client
 _http_client: Optional[httpx.AsyncClient] = None
 _graphql_client: Optional[GraphQLClient] = None
+_batcher: Optional[GraphQLBatcher] = None
 
 
 async def get_graphql_client() -> GraphQLClient:
     """Get or create the GraphQL client."""
-    global _http_client, _graphql_client
+    global _http_client, _graphql_client, _batcher
     
     if _graphql_client is None:
         # Get API configuration from environment
@@ -33,23 +71,57 @@ async def get_graphql_client() -> GraphQLClient:
         endpoint = os.getenv("CFBD_ENDPOINT", "https://graphql.collegefootballdata.com/v1/graphql")
         headers = {"Authorization": f"Bearer {api_key}"}
         
-        # Create HTTP client if needed
+        # Create HTTP client if needed. A single pooled HTTP/2 client is shared
+        # by every tool so TCP + TLS setup happens once, not per invocation.
         if _http_client is None:
             _http_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(30.0),
-                limits=httpx.Limits(max_connections=20)
+                http2=True,
+                timeout=httpx.Timeout(float(os.getenv("QUERY_TIMEOUT", "30"))),
+                limits=httpx.Limits(
+                    max_keepalive_connections=_MAX_CONNECTIONS,
+                    max_connections=_MAX_CONNECTIONS,
+                    keepalive_expiry=_KEEPALIVE_EXPIRY
+                )
             )
         
         _graphql_client = GraphQLClient(
             http_client=_http_client,
             endpoint=endpoint,
-            headers=headers
+            headers=headers,
+            max_retries=int(os.getenv("MAX_RETRIES", "3")),
+            persisted_queries=_PERSISTED_QUERIES_ENABLED,
+            conditional_requests=_CONDITIONAL_REQUESTS_ENABLED
         )
+        
+        if _BATCHING_ENABLED:
+            _batcher = GraphQLBatcher(
+                _graphql_client,
+                window=_BATCH_WINDOW_MS / 1000,
+                max_batch_size=_BATCH_MAX_SIZE,
+                max_concurrency=_BATCH_CONCURRENCY
+            )
     
     return _graphql_client
 
 
-async def execute_graphql(query: str, variables: Dict[str, Any] = None, ctx: Context = None) -> str:
+@lru_cache(maxsize=128)
+def _add_cached_directive(query: str, ttl: int) -> str:
+    """Attach Hasura's @cached(ttl) directive to a query operation."""
+    # Directives go between the operation's variable definitions and its
+    # selection set, i.e. just before the first opening brace
+    index = query.find("{")
+    if index == -1:
+        return query
+    return f"{query[:index].rstrip()} @cached(ttl: {ttl}) {query[index:]}"
+
+
+async def execute_graphql(
+    query: str,
+    variables: Dict[str, Any] = None,
+    ctx: Context = None,
+    cache_ttl: Optional[int] = None,
+    return_raw_dict: bool = False
+) -> Union[str, Dict[str, Any]]:
     """
     Execute a GraphQL query.
     
@@ -57,23 +129,58 @@ async def execute_graphql(query: str, variables: Dict[str, Any] = None, ctx: Con
         query: GraphQL query string
         variables: Query variables dictionary
         ctx: MCP context for logging
+        cache_ttl: Seconds the server may cache this response (for data that
+            no longer changes); applied when CFBD_HASURA_CACHE is enabled
+        return_raw_dict: Return the parsed response instead of serializing
+            it, for callers that post-process or format the data. The dict
+            may be shared with concurrent callers and must not be mutated.
     
     Returns:
-        JSON string containing the query results
+        JSON string containing the query results, or the response dict if
+        return_raw_dict is set
     
     Raises:
         GraphQLError: If query execution fails
     """
     variables = variables or {}
     
+    # Identical concurrent calls (e.g. simultaneous tool invocations for the
+    # same week) await the first caller's request instead of issuing their own
+    key = (query, orjson.dumps(variables, option=orjson.OPT_SORT_KEYS), cache_ttl, return_raw_dict)
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_execute_graphql(query, variables, ctx, cache_ttl, return_raw_dict))
+        _in_flight[key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
+    
+    # Shield so one caller's cancellation doesn't cancel the shared request
+    return await asyncio.shield(task)
+
+
+async def _execute_graphql(
+    query: str,
+    variables: Dict[str, Any],
+    ctx: Context,
+    cache_ttl: Optional[int],
+    return_raw_dict: bool
+) -> Union[str, Dict[str, Any]]:
+    """Execute a GraphQL query without in-flight deduplication (see execute_graphql)."""
+    if cache_ttl and _HASURA_CACHE_ENABLED:
+        query = _add_cached_directive(query, cache_ttl)
+    
     try:
         if ctx:
             await ctx.info(f"Executing GraphQL query with {len(variables)} variables")
         
         client = await get_graphql_client()
-        result = await client.execute_query(query, variables, ctx)
+        if _batcher is not None:
+            result = await _batcher.submit(query, variables, ctx)
+        else:
+            result = await client.execute_query(query, variables, ctx)
         
-        return json.dumps(result, indent=2)
+        if return_raw_dict:
+            return result
+        return orjson.dumps(result).decode()
     
     except GraphQLError:
         # Re-raise GraphQL errors as-is
@@ -85,6 +192,21 @@ async def execute_graphql(query: str, variables: Dict[str, Any] = None, ctx: Con
         raise GraphQLError(error_msg)
 
 
+async def warm_up_connection() -> None:
+    """
+    Open a connection to the GraphQL endpoint ahead of the first tool call.
+    
+    Sends a trivial query so TCP, TLS, and HTTP/2 setup happen at startup
+    rather than on a user's first request. Failures are only logged; the
+    first real query will connect (and report errors) as usual.
+    """
+    try:
+        client = await get_graphql_client()
+        await client.execute_query(_WARM_UP_QUERY)
+    except Exception as e:
+        logger.debug(f"Connection warm-up failed: {e}")
+
+
 def build_query_variables(**kwargs) -> Dict[str, Any]:
     """
     Build GraphQL variables dict, filtering out None values.
@@ -100,8 +222,9 @@ def build_query_variables(**kwargs) -> Dict[str, Any]:
 
 async def cleanup():
     """Clean up HTTP client resources."""
-    global _http_client, _graphql_client
+    global _http_client, _graphql_client, _batcher
     if _http_client:
         await _http_client.aclose()
         _http_client = None
-        _graphql_client = None
\ No newline at end of file
+        _graphql_client = None
+        _batcher = None
\ No newline at end of file
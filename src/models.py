@@ -2,7 +2,7 @@
 Data models and configuration classes for the NCAAF GraphQL MCP Server.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Literal, Optional, Any
 from pydantic import BaseModel, ValidationError, Field, field_validator
 
 
@@ -33,4 +33,123 @@ class SchemaType(BaseModel):
     name: str
     kind: str
     description: Optional[str] = None
-    fields: List[SchemaField] = Field(default_factory=list)
\ No newline at end of file
+    fields: List[SchemaField] = Field(default_factory=list)
+
+
+# Upper bound on result-set size for any tool query; larger requests are
+# clamped rather than rejected
+MAX_QUERY_LIMIT = 500
+
+
+def _clean_tool_arg(value: Any) -> Any:
+    """Strip whitespace/stray quotes and lowercase string tool arguments; empty strings become None"""
+    if isinstance(value, str):
+        cleaned = value.strip().strip('"').strip("'").lower()
+        return cleaned if cleaned else None
+    return value
+
+
+class ToolArgs(BaseModel):
+    """
+    Base for tool argument models.
+    
+    Agents send numbers and booleans as strings ("2024", "true"), so
+    arguments are cleaned once and then coerced by pydantic-core in a single
+    validation call instead of per-parameter safe_*_conversion calls.
+    A `limit` field is capped at MAX_QUERY_LIMIT.
+    """
+    
+    @field_validator('limit', check_fields=False)
+    @classmethod
+    def cap_limit(cls, value: int) -> int:
+        return min(value, MAX_QUERY_LIMIT)
+    
+    @classmethod
+    def from_tool_args(cls, **kwargs: Any):
+        """
+        Validate raw tool arguments, letting omitted (None or empty) values take field defaults.
+        
+        Only string arguments are cleaned; native ints and bools, the common
+        case for programmatic callers, go straight to pydantic-core.
+        """
+        data = {}
+        for key, value in kwargs.items():
+            if type(value) is str:
+                value = _clean_tool_arg(value)
+            if value is not None:
+                data[key] = value
+        return cls.model_validate(data)
+
+
+class BettingLinesArgs(ToolArgs):
+    """GetBettingLines argument validation (team is resolved separately)"""
+    season: Optional[int] = None
+    week: Optional[int] = None
+    season_type: Optional[Literal['regular', 'postseason']] = None
+    limit: int = Field(50, gt=0)
+    calculate_records: bool = False
+    include_raw_data: bool = False
+    allow_unbounded: bool = False
+
+
+class GamesArgs(ToolArgs):
+    """GetGames argument validation (team is resolved separately)"""
+    season: Optional[int] = None
+    week: Optional[int] = None
+    season_type: Optional[Literal['regular', 'postseason']] = None
+    limit: int = Field(100, gt=0)
+    include_betting_lines: bool = False
+    include_weather: bool = False
+    include_media: bool = False
+    detail_level: Literal['summary', 'full'] = 'full'
+    calculate_stats: bool = False
+    include_raw_data: bool = False
+    allow_unbounded: bool = False
+
+
+class GamesByWeekArgs(ToolArgs):
+    """GetGamesByWeek argument validation"""
+    season: int
+    week: int
+    season_type: Optional[Literal['regular', 'postseason']] = None
+    limit: int = Field(MAX_QUERY_LIMIT, gt=0)
+    calculate_weekly_trends: bool = False
+    include_raw_data: bool = False
+
+
+class TeamGamesArgs(ToolArgs):
+    """GetTeamGames argument validation (team is resolved separately)"""
+    season: Optional[int] = None
+    season_type: Optional[Literal['regular', 'postseason']] = None
+    limit: int = Field(MAX_QUERY_LIMIT, gt=0)
+    calculate_performance: bool = False
+    include_raw_data: bool = False
+
+
+class RecentGamesArgs(ToolArgs):
+    """GetRecentGames argument validation"""
+    limit: int = Field(20, gt=0)
+    include_raw_data: bool = False
+
+
+class MetricsArgs(ToolArgs):
+    """GetAdvancedMetrics argument validation (team is resolved separately)"""
+    season: Optional[int] = None
+    include_raw_data: bool = False
+
+
+class RankingsArgs(ToolArgs):
+    """GetRankings argument validation (poll_type and team are passed through as given)"""
+    season: Optional[int] = None
+    week: Optional[int] = None
+    top_n: int = 25
+    movement: bool = False
+    calculate_movement: bool = False
+    include_raw_data: bool = False
+
+
+class BettingAnalysisArgs(ToolArgs):
+    """GetBettingAnalysis argument validation (team/opponent are resolved separately)"""
+    season: Optional[int] = None
+    last_n_games: int = Field(10, gt=0)
+    include_raw_data: bool = False
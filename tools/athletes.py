@@ -5,16 +5,24 @@ Athlete/Player-related MCP tools for college football data.
 from typing import Optional, Union, Annotated
 
 # Import from server module at package level
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from mcp_instance import mcp
+from src.graphql import precompute_query_encodings, validate_query_documents
 from src.graphql_executor import execute_graphql
 from utils.param_utils import safe_int_conversion, safe_bool_conversion
-from utils.graphql_utils import build_query_variables
+from utils.graphql_utils import build_query_variables, minify_query
 from utils.response_formatter import safe_format_response
 from utils.team_resolver import resolve_optional_team_id
 from queries.athletes import GET_ATHLETES_QUERY
+
+# Sent minified, with the request encoding and APQ hash computed (and the
+# document optionally validated) once at import
+GET_ATHLETES_QUERY = minify_query(GET_ATHLETES_QUERY)
+_ATHLETE_QUERIES = (GET_ATHLETES_QUERY,)
+
+precompute_query_encodings(_ATHLETE_QUERIES)
+validate_query_documents(_ATHLETE_QUERIES)
+
+
 @mcp.tool()
 async def GetAthletes(
     team: Annotated[Optional[str], "Team name, abbreviation, or ID (e.g., 'Alabama', 'BAMA', '333')"] = None,
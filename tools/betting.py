@@ -2,36 +2,101 @@
 Betting-related MCP tools for college football data.
 """
 
-from typing import Optional, Union, Annotated
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, Union, Annotated
 
 # Import from server module at package level
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from mcp_instance import mcp
+from src.graphql import precompute_query_encodings, validate_query_documents
 from src.graphql_executor import execute_graphql
-from utils.param_utils import safe_int_conversion, safe_bool_conversion, preprocess_betting_params
-from utils.graphql_utils import build_query_variables
-from utils.response_formatter import safe_format_response
-from utils.team_resolver import resolve_optional_team_id
+from src.models import GraphQLError, BettingLinesArgs, BettingAnalysisArgs
+from utils.graphql_utils import build_query_variables, inline_variable, minify_query, project_selection_set
+from utils import json_utils
+from utils.query_cache import cached_execute_graphql, cached_value, HISTORICAL_TTL
+from utils.response_formatter import safe_format_response, create_formatted_response, REQUIRED_FIELDS
+from utils.team_resolver import resolve_team_id, resolve_optional_team_id
+from utils.betting_utils import (
+    analyze_head_to_head,
+    analyze_betting_trends,
+    format_betting_analysis_response,
+    find_team_name,
+    build_scenario_where,
+    build_team_betting_where,
+    build_betting_lines_where,
+    build_betting_analysis_bundle,
+    calculate_betting_analysis_from_graphql
+)
+from utils.game_utils import is_historical_season, CURRENT_SEASON
 from queries.betting import (
-    GET_BETTING_LINES_WITH_SEASON_WEEK_QUERY,
-    GET_BETTING_LINES_WITH_SEASON_QUERY,
-    GET_BETTING_LINES_WITH_WEEK_QUERY,
-    GET_BETTING_LINES_WITH_TEAM_QUERY,
-    GET_BETTING_LINES_WITH_TEAM_NO_SEASON_QUERY,
-    GET_ALL_BETTING_LINES_QUERY,
+    GET_BETTING_LINES_QUERY,
+    GET_TEAM_BETTING_RESULTS_QUERY,
+    GET_TEAM_NAME_QUERY
+)
+
+# Formatted responses only read some of the game fields; the full selection
+# is kept for include_raw_data callers
+GET_BETTING_LINES_FORMATTED_QUERY = project_selection_set(GET_BETTING_LINES_QUERY, REQUIRED_FIELDS['betting'])
+
+
+def _current_season_variant(query: str) -> str:
+    """Inline the league-wide current-season filter as literals."""
+    return inline_variable(query, "where", f"{{ _and: [{{ lines: {{}} }}, {{ season: {{ _eq: {CURRENT_SEASON} }} }}] }}")
+
+
+# League-wide lines for the current season are the most common request;
+# these variants inline its filter so the server can plan for the literals
+GET_BETTING_LINES_CURRENT_SEASON_QUERY = _current_season_variant(GET_BETTING_LINES_QUERY)
+GET_BETTING_LINES_FORMATTED_CURRENT_SEASON_QUERY = _current_season_variant(GET_BETTING_LINES_FORMATTED_QUERY)
+
+# Sent minified; the variants above are derived first, since printing the
+# edited AST re-indents them
+GET_BETTING_LINES_QUERY = minify_query(GET_BETTING_LINES_QUERY)
+GET_BETTING_LINES_FORMATTED_QUERY = minify_query(GET_BETTING_LINES_FORMATTED_QUERY)
+GET_BETTING_LINES_CURRENT_SEASON_QUERY = minify_query(GET_BETTING_LINES_CURRENT_SEASON_QUERY)
+GET_BETTING_LINES_FORMATTED_CURRENT_SEASON_QUERY = minify_query(GET_BETTING_LINES_FORMATTED_CURRENT_SEASON_QUERY)
+GET_TEAM_BETTING_RESULTS_QUERY = minify_query(GET_TEAM_BETTING_RESULTS_QUERY)
+GET_TEAM_NAME_QUERY = minify_query(GET_TEAM_NAME_QUERY)
+
+# Request encodings and APQ hashes for every betting document are computed
+# (and the documents optionally validated) at import
+_BETTING_QUERIES = (
+    GET_BETTING_LINES_QUERY,
+    GET_BETTING_LINES_FORMATTED_QUERY,
+    GET_BETTING_LINES_CURRENT_SEASON_QUERY,
+    GET_BETTING_LINES_FORMATTED_CURRENT_SEASON_QUERY,
+    GET_TEAM_BETTING_RESULTS_QUERY,
     GET_TEAM_NAME_QUERY
 )
+
+precompute_query_encodings(_BETTING_QUERIES)
+validate_query_documents(_BETTING_QUERIES)
+
+# Team names are stable, so team_id -> school lookups are cached for the
+# lifetime of the process
+_TEAM_NAME_CACHE: Dict[int, str] = {}
+
+# Team-level betting analysis covers up to this many of a team's games, so
+# multi-season requests are not truncated at the tools' usual page size
+_ANALYSIS_MAX_GAMES = 500
+
+# Raw-data payloads for GetBettingAnalysis error responses
+_INVALID_TEAM_TEMPLATE = '{"error": "Invalid team_id"}'
+_ERR_TEMPLATE = '{"error": "GraphQL query failed"}'
+
+# GetBettingLines response when no filter narrows the query
+_UNBOUNDED_TEMPLATE = '{"error": "Provide a season, week, or team filter (or set allow_unbounded=true)"}'
+
+
 @mcp.tool() 
 async def GetBettingLines(
     season: Annotated[Optional[Union[str, int]], "Season year"] = None,
     week: Annotated[Optional[Union[str, int]], "Week number"] = None,
     team: Annotated[Optional[str], "Team name, abbreviation, or ID (e.g., 'Alabama', 'BAMA', '333')"] = None,
     season_type: Annotated[Optional[str], "Season type filter ('regular', 'postseason', or None for both)"] = None,
-    limit: Annotated[Optional[Union[str, int]], "Maximum number of games to return"] = 50,
+    limit: Annotated[Optional[Union[str, int]], "Maximum number of games to return (max 500)"] = 50,
     calculate_records: Annotated[Union[str, bool], "Calculate ATS, Over/Under, and SU records"] = False,
-    include_raw_data: Annotated[Union[str, bool], "Include raw GraphQL response data"] = False
+    include_raw_data: Annotated[Union[str, bool], "Include raw GraphQL response data"] = False,
+    allow_unbounded: Annotated[Union[str, bool], "Allow a query with no season, week, or team filter"] = False
 ) -> str:
     """
     Get betting lines for games.
@@ -41,117 +106,158 @@ async def GetBettingLines(
         week: Week number (can be string or int)
         team: Team name, abbreviation, or ID (e.g., "Alabama", "BAMA", "333")
         season_type: Season type filter ("regular", "postseason", or None for both)
-        limit: Maximum number of games to return (default: 50, can be string or int)
+        limit: Maximum number of games to return (default: 50, can be string or int, max 500)
         calculate_records: Calculate ATS, Over/Under, and SU records (default: false)
         include_raw_data: Include raw GraphQL response data (default: false)
+        allow_unbounded: Allow a query with no season, week, or team filter (default: false)
     
     Returns:
         JSON string with betting lines data, optionally enhanced with betting analysis
     """
-    # Process parameters using consolidated utility
-    include_raw_data_bool = safe_bool_conversion(include_raw_data, 'include_raw_data')
-    
-    # Resolve team to ID if provided
-    team_id = await resolve_optional_team_id(team)
-    
-    params = preprocess_betting_params(
+    # Validate and coerce parameters in one pass
+    args = BettingLinesArgs.from_tool_args(
         season=season,
         week=week,
-        team_id=team_id,
         season_type=season_type,
         limit=limit,
-        calculate_records=calculate_records
+        calculate_records=calculate_records,
+        include_raw_data=include_raw_data,
+        allow_unbounded=allow_unbounded
     )
     
+    # Lines for every game ever played are rarely intended; reject before
+    # resolving the team or touching the API
+    if not team and args.season is None and args.week is None and not args.allow_unbounded:
+        return _UNBOUNDED_TEMPLATE
+    
+    # Resolve team to ID if provided
+    team_id_int = await resolve_optional_team_id(team)
+    
     # Extract processed values
-    season_int = params.get('season')
-    week_int = params.get('week')
-    team_id_int = params.get('team_id')
-    season_type_str = params.get('season_type')
-    limit_int = params.get('limit')
-    calculate_records_bool = params.get('calculate_records')
+    season_int = args.season
+    week_int = args.week
+    season_type_str = args.season_type
+    limit_int = args.limit
+    calculate_records_bool = args.calculate_records
+    include_raw_data_bool = args.include_raw_data
     
-    # Select appropriate query based on which parameters are provided
-    if team_id_int is not None:
-        # Team-specific queries
-        if season_int is not None:
-            query = GET_BETTING_LINES_WITH_TEAM_QUERY
-            variables = build_query_variables(teamId=team_id_int, season=season_int, limit=limit_int)
-        else:
-            query = GET_BETTING_LINES_WITH_TEAM_NO_SEASON_QUERY
-            variables = build_query_variables(teamId=team_id_int, limit=limit_int)
-    elif season_int is not None and week_int is not None:
-        # Both season and week
-        query = GET_BETTING_LINES_WITH_SEASON_WEEK_QUERY
-        variables = build_query_variables(season=season_int, week=week_int, limit=limit_int)
-    elif season_int is not None:
-        # Only season
-        query = GET_BETTING_LINES_WITH_SEASON_QUERY
-        variables = build_query_variables(season=season_int, limit=limit_int)
-    elif week_int is not None:
-        # Only week
-        query = GET_BETTING_LINES_WITH_WEEK_QUERY
-        variables = build_query_variables(week=week_int, limit=limit_int)
-    else:
-        # No filters - get all games with betting lines
-        query = GET_ALL_BETTING_LINES_QUERY
+    # One query document serves every filter combination; filters,
+    # including season type, are applied server-side
+    if season_int == CURRENT_SEASON and team_id_int is None and week_int is None and season_type_str is None:
+        query = GET_BETTING_LINES_CURRENT_SEASON_QUERY if include_raw_data_bool else GET_BETTING_LINES_FORMATTED_CURRENT_SEASON_QUERY
         variables = build_query_variables(limit=limit_int)
+    else:
+        # Records need the team names and IDs the formatted projection drops
+        full_selection = include_raw_data_bool or (calculate_records_bool and team_id_int)
+        query = GET_BETTING_LINES_QUERY if full_selection else GET_BETTING_LINES_FORMATTED_QUERY
+        where = build_betting_lines_where(team_id_int, season_int, week_int, season_type_str)
+        variables = build_query_variables(where=where, limit=limit_int)
     
-    # Execute the GraphQL query
-    result = await execute_graphql(query, variables)
-    
-    # Apply client-side seasonType filtering if specified
-    if season_type_str is not None:
-        try:
-            import json
-            result_data = json.loads(result)
-            if 'data' in result_data and 'game' in result_data['data']:
-                filtered_games = [
-                    game for game in result_data['data']['game'] 
-                    if game.get('seasonType') == season_type_str
-                ]
-                result_data['data']['game'] = filtered_games
-                result = json.dumps(result_data, indent=2)
-        except Exception:
-            # Don't fail the main query if filtering fails
-            pass
+    # Execute the GraphQL query. The response stays a dict until the single
+    # serialization at return.
+    result = await cached_execute_graphql(query, variables, season=season_int, return_raw_dict=True)
     
-    # Add betting analysis if requested and we have a team_id
+    # Add betting analysis if requested and we have a team_id. Records cover
+    # the games returned, so week, season type and limit apply to them too.
+    # The calculation is CPU-bound, so it runs off the event loop.
     if calculate_records_bool and team_id_int:
-        try:
-            # Import betting utilities
-            import sys
-            import os
-            sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-            from utils.betting_utils import calculate_betting_analysis_from_graphql
-            
-            # Calculate betting analysis
-            betting_analysis = calculate_betting_analysis_from_graphql(result, team_id_int)
-            
-            if betting_analysis and 'error' not in betting_analysis:
-                # Parse the result to add betting summary (avoid duplication)
-                import json
-                result_data = json.loads(result)
-                # Only add the summary, not the full game_details to avoid duplication
-                result_data['betting_summary'] = betting_analysis.get('summary', betting_analysis)
-                result = json.dumps(result_data, indent=2)
-            elif betting_analysis and 'error' in betting_analysis:
-                # Add error info but don't fail the whole query
-                result_data = json.loads(result)
-                result_data['betting_analysis_error'] = betting_analysis['error']
-                result = json.dumps(result_data, indent=2)
-                
-        except Exception as e:
-            # Don't fail the main query if betting analysis fails
-            pass  # Don't fail the main query if betting analysis fails
+        betting_analysis = await asyncio.get_running_loop().run_in_executor(
+            None, calculate_betting_analysis_from_graphql, result, team_id_int
+        )
+        
+        # Copy the top level: the cached response itself is shared
+        if betting_analysis and 'error' not in betting_analysis:
+            # Only add the summary, not the full game_details to avoid duplication
+            result = {**result, 'betting_summary': betting_analysis['summary']}
+        elif betting_analysis:
+            # Add error info but don't fail the whole query
+            result = {**result, 'betting_analysis_error': betting_analysis['error']}
     
     # Format response based on include_raw_data flag
     if include_raw_data_bool:
-        return result
+        return json_utils.dumps(result)
     else:
         return safe_format_response(result, 'betting', include_raw_data_bool)
 
 
+async def get_team_name(team_id: int) -> Optional[str]:
+    """Look up a team's school name, returning None if it cannot be resolved."""
+    team_name = _TEAM_NAME_CACHE.get(team_id)
+    if team_name is not None:
+        return team_name
+    
+    try:
+        team_variables = build_query_variables(teamId=team_id)
+        team_result = await execute_graphql(GET_TEAM_NAME_QUERY, team_variables, return_raw_dict=True)
+        teams = (team_result.get('data') or {}).get('currentTeams') or []
+        if teams and teams[0].get('school'):
+            team_name = teams[0]['school']
+            _TEAM_NAME_CACHE[team_id] = team_name
+    except (GraphQLError, KeyError, TypeError):
+        # Head-to-head analysis is skipped without the opponent's name
+        pass
+    
+    return team_name
+
+
+async def _get_games_and_analysis(
+    team_id: int,
+    season: Optional[int] = None,
+    scenario: Optional[str] = None
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Fetch a team's games with betting lines and precompute shared analyses.
+    
+    Up to _ANALYSIS_MAX_GAMES games are fetched in one request so
+    multi-season requests are not silently truncated. Results go through the
+    query cache, so repeated and concurrent analyses for the same team and
+    season fetch and process the games once.
+    
+    Args:
+        team_id: Team ID to analyze
+        season: Optional season filter
+        scenario: Optional betting scenario filter (see build_scenario_where)
+        
+    Returns:
+        Tuple of (GraphQL response dict, games, analysis bundle). The bundle is
+        None when there are no games or the team name cannot be determined.
+        The tuple is shared with other callers and must not be mutated.
+    """
+    # Push scenario filtering into the query so only matching games are fetched
+    where = build_scenario_where(team_id, scenario, season) if scenario else None
+    if where is None:
+        where = build_team_betting_where(team_id, season)
+    variables = build_query_variables(where=where, limit=_ANALYSIS_MAX_GAMES)
+    
+    async def build() -> Tuple[Dict[str, Any], List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        cache_ttl = HISTORICAL_TTL if is_historical_season(season) else None
+        result = await execute_graphql(GET_TEAM_BETTING_RESULTS_QUERY, variables, cache_ttl=cache_ttl, return_raw_dict=True)
+        games = (result.get('data') or {}).get('game') or []
+        
+        if not games:
+            return result, games, None
+        
+        team_name = _TEAM_NAME_CACHE.get(team_id) or find_team_name(games, team_id)
+        if not team_name:
+            return result, games, None
+        _TEAM_NAME_CACHE[team_id] = team_name
+        
+        # The analysis is CPU-bound; run it off the event loop so other
+        # requests keep making progress meanwhile
+        bundle = await asyncio.get_running_loop().run_in_executor(
+            None, build_betting_analysis_bundle, games, team_name
+        )
+        return result, games, bundle
+    
+    return await cached_value(
+        GET_TEAM_BETTING_RESULTS_QUERY,
+        variables,
+        ('analysis', team_id, season, scenario),
+        build,
+        season=season
+    )
+
+
 @mcp.tool()
 async def GetBettingAnalysis(
     team: Annotated[str, "Team name, abbreviation, or ID (e.g., 'Alabama', 'BAMA', '333')"],
@@ -195,50 +301,38 @@ async def GetBettingAnalysis(
         YAML formatted betting analysis with actionable insights
     """
     # Process parameters
-    from utils.param_utils import safe_int_conversion, safe_bool_conversion, preprocess_betting_params
-    from utils.graphql_utils import build_query_variables
-    from utils.response_formatter import create_formatted_response
-    from utils.betting_utils import (
-        analyze_spread_ranges, 
-        analyze_head_to_head, 
-        analyze_betting_trends,
-        analyze_over_under_ranges,
-        format_betting_analysis_response
+    args = BettingAnalysisArgs.from_tool_args(
+        season=season or None,
+        last_n_games=last_n_games or None,
+        include_raw_data=include_raw_data
     )
-    
-    # Resolve team names to IDs
-    from utils.team_resolver import resolve_team_id, resolve_optional_team_id
+    season_int = args.season
+    last_n_games_int = args.last_n_games
+    include_raw_data_bool = args.include_raw_data
     
     team_id_int = await resolve_team_id(team)
     opponent_id_int = await resolve_optional_team_id(opponent)
-    season_int = safe_int_conversion(season, 'season') if season else None
-    last_n_games_int = safe_int_conversion(last_n_games, 'last_n_games') if last_n_games else 10
-    include_raw_data_bool = safe_bool_conversion(include_raw_data, 'include_raw_data')
     
     if not team_id_int:
         return create_formatted_response(
-            '{"error": "Invalid team_id"}',
+            _INVALID_TEAM_TEMPLATE,
             {"error": "Invalid team_id provided"},
             [],
             include_raw_data_bool
         )
     
-    # Determine which GraphQL query to use (reuse existing queries from GetBettingLines)
-    if season_int:
-        query = GET_BETTING_LINES_WITH_TEAM_QUERY
-        variables = build_query_variables(teamId=team_id_int, season=season_int, limit=100)
-    else:
-        query = GET_BETTING_LINES_WITH_TEAM_NO_SEASON_QUERY
-        variables = build_query_variables(teamId=team_id_int, limit=100)
-    
     # Execute the GraphQL query to get raw game data
     try:
-        result = await execute_graphql(query, variables)
-        
-        # Parse games from GraphQL result
-        import json
-        data = json.loads(result)
-        games = data.get('data', {}).get('game', [])
+        # Opponent name lookup is independent of the games query, so both
+        # requests are issued concurrently over the shared connection pool
+        if opponent_id_int and analysis_type in ['h2h', 'all']:
+            (result, games, bundle), opponent_name = await asyncio.gather(
+                _get_games_and_analysis(team_id_int, season_int, scenario),
+                get_team_name(opponent_id_int)
+            )
+        else:
+            result, games, bundle = await _get_games_and_analysis(team_id_int, season_int, scenario)
+            opponent_name = None
         
         if not games:
             return create_formatted_response(
@@ -248,61 +342,30 @@ async def GetBettingAnalysis(
                 include_raw_data_bool
             )
         
-        # Get team name from first game
-        team_name = None
-        for game in games:
-            home_team_info = game.get('homeTeamInfo', {})
-            away_team_info = game.get('awayTeamInfo', {})
-            
-            if home_team_info.get('teamId') == team_id_int:
-                team_name = home_team_info.get('school')
-                break
-            elif away_team_info.get('teamId') == team_id_int:
-                team_name = away_team_info.get('school')
-                break
-        
-        if not team_name:
+        if not bundle:
             return create_formatted_response(
                 result,
                 {"error": "Could not determine team name", "team_id": team_id_int},
                 [],
                 include_raw_data_bool
             )
+        team_name = bundle['team_name']
         
-        # Get opponent name if doing H2H analysis
-        opponent_name = None
-        if opponent_id_int and analysis_type in ['h2h', 'all']:
-            # Use imported GET_TEAM_NAME_QUERY from queries.betting
-            from utils.graphql_utils import build_query_variables
-            
-            try:
-                team_variables = build_query_variables(teamId=opponent_id_int)
-                team_result = await execute_graphql(GET_TEAM_NAME_QUERY, team_variables)
-                team_data = json.loads(team_result)
-                teams = team_data.get('data', {}).get('currentTeams', [])
-                if teams:
-                    opponent_name = teams[0].get('school')
-            except:
-                pass  # If we can't get opponent name, skip H2H analysis
-        
-        # Apply scenario filter if provided
-        from utils.betting_utils import filter_games_by_scenario
-        filtered_games = filter_games_by_scenario(games, team_name, scenario) if scenario else games
+        # Scenario filtering already applied server-side
+        filtered_games = games
         
         # Perform requested analysis
         analysis_results = {}
         
         if analysis_type in ['spread_ranges', 'all']:
-            spread_analysis = analyze_spread_ranges(filtered_games, team_name)
-            analysis_results['spread_ranges'] = spread_analysis
+            analysis_results['spread_ranges'] = bundle['spread_ranges']
         
         if analysis_type in ['h2h', 'all'] and opponent_name:
             h2h_analysis = analyze_head_to_head(filtered_games, team_name, opponent_name)
             analysis_results['h2h'] = h2h_analysis
         
         if analysis_type in ['over_under', 'all']:
-            ou_analysis = analyze_over_under_ranges(filtered_games, team_name)
-            analysis_results['over_under'] = ou_analysis
+            analysis_results['over_under'] = bundle['over_under']
         
         if analysis_type in ['trends', 'all']:
             trend_analysis = analyze_betting_trends(filtered_games, team_name, last_n_games_int)
@@ -396,10 +459,12 @@ async def GetBettingAnalysis(
                     include_raw_data_bool
                 )
         
-    except Exception as e:
+    except (GraphQLError, json_utils.JSONDecodeError, KeyError, TypeError) as e:
+        # The executor wraps transport failures (httpx errors, timeouts) in
+        # GraphQLError; anything else is a bug and should surface
         error_summary = {
             "error": f"Failed to perform betting analysis: {str(e)}",
             "team_id": team_id_int,
             "analysis_type": analysis_type
         }
-        return create_formatted_response('{"error": "GraphQL query failed"}', error_summary, [], include_raw_data_bool)
\ No newline at end of file
+        return create_formatted_response(_ERR_TEMPLATE, error_summary, [], include_raw_data_bool)
\ No newline at end of file
@@ -5,17 +5,23 @@ Depth Chart MCP tools for college football data.
 from typing import Optional, Union, Annotated
 
 # Import from server module at package level
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from mcp_instance import mcp
-from src.graphql_executor import execute_graphql
+from src.graphql import precompute_query_encodings, validate_query_documents
+from utils.query_cache import cached_execute_graphql
 from utils.param_utils import safe_int_conversion, safe_bool_conversion
-from utils.graphql_utils import build_query_variables
+from utils.graphql_utils import build_query_variables, minify_query
 from utils.response_formatter import safe_format_response
 from utils.team_resolver import resolve_team_id
 from queries.depth_chart import GET_DEPTH_CHART_QUERY
 
+# Sent minified, with the request encoding and APQ hash computed (and the
+# document optionally validated) once at import
+GET_DEPTH_CHART_QUERY = minify_query(GET_DEPTH_CHART_QUERY)
+_DEPTH_CHART_QUERIES = (GET_DEPTH_CHART_QUERY,)
+
+precompute_query_encodings(_DEPTH_CHART_QUERIES)
+validate_query_documents(_DEPTH_CHART_QUERIES)
+
 
 @mcp.tool()
 async def GetDepthChart(
@@ -59,7 +65,8 @@ async def GetDepthChart(
     
     # Build and execute query
     variables = build_query_variables(teamId=team_id_int, season=season_int)
-    result = await execute_graphql(GET_DEPTH_CHART_QUERY, variables)
+    # Raw output is returned as JSON text; the formatter takes the dict as-is
+    result = await cached_execute_graphql(GET_DEPTH_CHART_QUERY, variables, return_raw_dict=not include_raw_data_bool)
     
     # Format response as depth chart with filtering
     if include_raw_data_bool:
@@ -2,31 +2,131 @@
 Game-related MCP tools for college football data.
 """
 
-from typing import Optional, Union, Annotated
+import logging
+from collections import Counter
+from typing import Any, Callable, Dict, Optional, Tuple, Union, Annotated
 
 # Import from dedicated mcp module to avoid circular imports
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from mcp_instance import mcp
-from src.graphql_executor import execute_graphql
-from utils.param_utils import preprocess_game_params, safe_int_conversion, safe_bool_conversion, safe_string_conversion
-from utils.graphql_utils import build_query_variables
+from src.graphql import precompute_query_encodings, validate_query_documents
+from src.models import GamesArgs, GamesByWeekArgs, TeamGamesArgs, RecentGamesArgs
+from utils import json_utils
+from utils.query_cache import cached_execute_graphql, cached_response, clear_query_cache
+from utils.graphql_utils import minify_query
 from utils.response_formatter import safe_format_response
-from utils.team_resolver import resolve_optional_team_id
+from utils.team_resolver import resolve_team_id, resolve_optional_team_id
+from utils.game_utils import calculate_game_stats_from_graphql
+from utils.team_utils import calculate_team_performance_from_graphql
 from queries.games import (
-    GET_GAMES_WITH_SEASON_WEEK_SEASONTYPE_QUERY,
-    GET_GAMES_WITH_SEASON_WEEK_QUERY,
-    GET_GAMES_WITH_SEASON_SEASONTYPE_QUERY,
-    GET_GAMES_WITH_SEASON_QUERY,
-    GET_GAMES_WITH_WEEK_QUERY,
-    GET_ALL_GAMES_QUERY,
-    GET_GAMES_BY_WEEK_QUERY,
-    GET_TEAM_GAMES_WITH_SEASON_QUERY,
+    GET_GAMES_QUERY,
     GET_TEAM_GAMES_QUERY,
     GET_RECENT_GAMES_QUERY
 )
 
+# Send documents without indentation or comments, which are most of their
+# bytes; done once here so the minified text is what gets encoded and hashed
+GET_GAMES_QUERY = minify_query(GET_GAMES_QUERY)
+GET_TEAM_GAMES_QUERY = minify_query(GET_TEAM_GAMES_QUERY)
+GET_RECENT_GAMES_QUERY = minify_query(GET_RECENT_GAMES_QUERY)
+
+# Every query document the games tools send; request encodings and APQ
+# hashes are computed (and, optionally, the documents validated) at import,
+# and clear_games_cache flushes their entries
+_GAMES_QUERIES = (
+    GET_GAMES_QUERY,
+    GET_TEAM_GAMES_QUERY,
+    GET_RECENT_GAMES_QUERY
+)
+
+precompute_query_encodings(_GAMES_QUERIES)
+validate_query_documents(_GAMES_QUERIES)
+
+logger = logging.getLogger(__name__)
+
+# Analyses that raised rather than reporting an error, by response key
+_analysis_failures: Counter = Counter()
+
+
+def clear_games_cache() -> None:
+    """Drop cached responses for the games tools (e.g. after scores are corrected)."""
+    clear_query_cache(_GAMES_QUERIES)
+
+
+def _games_where(season: Optional[int], week: Optional[int],
+                 season_type: Optional[str], team_id: Optional[int] = None) -> Dict[str, Any]:
+    """Build a games `where` filter from whichever values were provided."""
+    where = {}
+    if team_id is not None:
+        where['_or'] = [
+            {'homeTeamId': {'_eq': team_id}},
+            {'awayTeamId': {'_eq': team_id}}
+        ]
+    if season is not None:
+        where['season'] = {'_eq': season}
+    if week is not None:
+        where['week'] = {'_eq': week}
+    if season_type is not None:
+        where['seasonType'] = {'_eq': season_type}
+    return where
+
+
+def _attach_analysis(result: Dict[str, Any], key: str,
+                     analyze: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Add an analysis of the games to a copy of the response under `key`.
+    
+    An analysis that reports an error is added as `<key>_error`; one that
+    raises on unexpected data leaves the response unchanged and is counted
+    and logged.
+    """
+    try:
+        analysis = analyze(result)
+    except (ValueError, KeyError, TypeError, AttributeError, ZeroDivisionError) as e:
+        # Don't fail the main query if the analysis fails
+        _analysis_failures[key] += 1
+        logger.warning(f"{key} analysis failed ({_analysis_failures[key]} so far): {e}")
+        return result
+    if not analysis:
+        return result
+    if 'error' in analysis:
+        return {**result, f'{key}_error': analysis['error']}
+    return {**result, key: analysis}
+
+
+def _format_games(result: Dict[str, Any], include_raw_data: bool) -> str:
+    """Serialize the raw response or format the games summary, once per call."""
+    if include_raw_data:
+        return json_utils.dumps(result)
+    return safe_format_response(result, 'games', include_raw_data)
+
+
+async def _games_response(query: str, variables: Dict[str, Any], include_raw_data: bool,
+                          season: Optional[int] = None,
+                          analysis: Optional[Tuple[str, Callable[[Dict[str, Any]], Dict[str, Any]]]] = None) -> str:
+    """
+    Fetch, optionally analyze, and format games for a tool call.
+    
+    The formatted output is cached alongside the response, so a repeated
+    identical call skips the analysis and formatting too.
+    
+    Args:
+        query: Games query document
+        variables: Query variables
+        include_raw_data: Return the raw response instead of the summary
+        season: Season the query is for (selects the cache lifetime)
+        analysis: (key, analyze) passed to _attach_analysis, if requested;
+            the key identifies the analysis in the cache
+    """
+    async def build() -> str:
+        result = await cached_execute_graphql(query, variables, season=season, return_raw_dict=True)
+        if analysis is not None:
+            result = _attach_analysis(result, *analysis)
+        return _format_games(result, include_raw_data)
+    
+    variant = ('games', include_raw_data, analysis[0] if analysis is not None else None)
+    return await cached_response(query, variables, variant, build, season=season)
+
+
 @mcp.tool()
 async def GetGames(
     season: Annotated[Optional[Union[str, int]], "Season year"] = None,
@@ -36,9 +136,11 @@ async def GetGames(
     include_betting_lines: Annotated[Union[str, bool], "Include betting line information"] = False,
     include_weather: Annotated[Union[str, bool], "Include weather data"] = False,
     include_media: Annotated[Union[str, bool], "Include media/TV information"] = False,
-    limit: Annotated[Optional[Union[str, int]], "Maximum number of games to return"] = None,
+    detail_level: Annotated[str, "'summary' (teams and scores only) or 'full' game details"] = "full",
+    limit: Annotated[Optional[Union[str, int]], "Maximum number of games to return (max 500)"] = None,
     calculate_stats: Annotated[Union[str, bool], "Calculate game statistics and trends"] = False,
-    include_raw_data: Annotated[Union[str, bool], "Include raw GraphQL response data"] = False
+    include_raw_data: Annotated[Union[str, bool], "Include raw GraphQL response data"] = False,
+    allow_unbounded: Annotated[Union[str, bool], "Allow a query with no season, week, or team filter"] = False
 ) -> str:
     """
     Get games with flexible filtering options.
@@ -51,183 +153,77 @@ async def GetGames(
         include_betting_lines: Include betting line information (can be string or bool)
         include_weather: Include weather data (can be string or bool)
         include_media: Include media/TV information (can be string or bool)
-        limit: Maximum number of games to return (can be string or int)
+        detail_level: "summary" omits notes, attendance, venue, start-time TBD
+            and team IDs/abbreviations/conferences; "full" includes them (default: "full")
+        limit: Maximum number of games to return (can be string or int, max 500)
         calculate_stats: Calculate game statistics and trends (default: false)
         include_raw_data: Include raw GraphQL response data (default: false)
+        allow_unbounded: Allow a query with no season, week, or team filter (default: false)
     
     Returns:
         JSON string with game information, optionally enhanced with statistical analysis
     """
-    # Preprocess parameters to handle string inputs
-    calculate_stats_bool = safe_bool_conversion(calculate_stats, 'calculate_stats')
-    include_raw_data_bool = safe_bool_conversion(include_raw_data, 'include_raw_data')
-    
-    # Resolve team to ID if provided
-    team_id = await resolve_optional_team_id(team)
-    
-    processed = preprocess_game_params(
+    # Validate and coerce parameters in one pass
+    args = GamesArgs.from_tool_args(
         season=season,
         week=week,
-        team_id=team_id,
         season_type=season_type,
         limit=limit,
         include_betting_lines=include_betting_lines,
         include_weather=include_weather,
-        include_media=include_media
+        include_media=include_media,
+        detail_level=detail_level,
+        calculate_stats=calculate_stats,
+        include_raw_data=include_raw_data,
+        allow_unbounded=allow_unbounded
+    )
+    calculate_stats_bool = args.calculate_stats
+    include_raw_data_bool = args.include_raw_data
+    season = args.season
+    week = args.week
+    season_type = args.season_type
+    limit_int = args.limit
+    include_flags = dict(
+        includeBettingLines=args.include_betting_lines,
+        includeWeather=args.include_weather,
+        includeMedia=args.include_media,
+        includeDetails=args.detail_level == 'full'
     )
     
-    # If team is provided, use the appropriate team games query
-    if processed.get('team_id'):
-        if processed.get('season') is not None:
-            # Use team games query with season filter
-            variables = build_query_variables(
-                teamId=processed.get('team_id'),
-                season=processed.get('season'),
-                limit=processed.get('limit')
-            )
-            result = await execute_graphql(GET_TEAM_GAMES_WITH_SEASON_QUERY, variables)
-        else:
-            # Use team games query without season filter
-            variables = build_query_variables(
-                teamId=processed.get('team_id'),
-                limit=processed.get('limit')
-            )
-            result = await execute_graphql(GET_TEAM_GAMES_QUERY, variables)
-        
-        # Apply client-side seasonType filtering for team games if specified
-        if season_type is not None:
-            try:
-                import json
-                result_data = json.loads(result)
-                if 'data' in result_data and 'game' in result_data['data']:
-                    filtered_games = [
-                        game for game in result_data['data']['game'] 
-                        if game.get('seasonType') == season_type
-                    ]
-                    result_data['data']['game'] = filtered_games
-                    result = json.dumps(result_data, indent=2)
-            except Exception:
-                # Don't fail the main query if filtering fails
-                pass
-        
-        # Format response based on include_raw_data flag
-        if include_raw_data_bool:
-            return result
-        else:
-            return safe_format_response(result, 'games', include_raw_data_bool)
+    # Resolve team to ID if provided
+    team_id = await resolve_optional_team_id(team)
+    
+    # If team is provided, use the team games query
+    if team_id:
+        variables = {
+            'where': _games_where(season, None, season_type, team_id=team_id),
+            'limit': limit_int
+        }
+        return await _games_response(GET_TEAM_GAMES_QUERY, variables, include_raw_data_bool, season=season)
     
-    # Select appropriate query based on which parameters are provided
-    season = processed.get('season')
-    week = processed.get('week')
-    season_type = processed.get('season_type')
+    # Filter on whichever of season, week, and season type were provided
+    where = _games_where(season, week, season_type)
     
-    if season is not None and week is not None:
-        # Both season and week provided
-        if season_type is not None:
-            query = GET_GAMES_WITH_SEASON_WEEK_SEASONTYPE_QUERY
-            variables = build_query_variables(
-                season=season,
-                week=week,
-                seasonType=season_type,
-                includeBettingLines=processed.get('include_betting_lines', False),
-                includeWeather=processed.get('include_weather', False),
-                includeMedia=processed.get('include_media', False),
-                limit=processed.get('limit')
-            )
-        else:
-            query = GET_GAMES_WITH_SEASON_WEEK_QUERY
-            variables = build_query_variables(
-                season=season,
-                week=week,
-                includeBettingLines=processed.get('include_betting_lines', False),
-                includeWeather=processed.get('include_weather', False),
-                includeMedia=processed.get('include_media', False),
-                limit=processed.get('limit')
-            )
-    elif season is not None:
-        # Only season provided
-        if season_type is not None:
-            query = GET_GAMES_WITH_SEASON_SEASONTYPE_QUERY
-            variables = build_query_variables(
-                season=season,
-                seasonType=season_type,
-                includeBettingLines=processed.get('include_betting_lines', False),
-                includeWeather=processed.get('include_weather', False),
-                includeMedia=processed.get('include_media', False),
-                limit=processed.get('limit')
-            )
-        else:
-            query = GET_GAMES_WITH_SEASON_QUERY
-            variables = build_query_variables(
-                season=season,
-                includeBettingLines=processed.get('include_betting_lines', False),
-                includeWeather=processed.get('include_weather', False),
-                includeMedia=processed.get('include_media', False),
-                limit=processed.get('limit')
-            )
-    elif week is not None:
-        # Only week provided
-        query = GET_GAMES_WITH_WEEK_QUERY
-        variables = build_query_variables(
-            week=week,
-            includeBettingLines=processed.get('include_betting_lines', False),
-            includeWeather=processed.get('include_weather', False),
-            includeMedia=processed.get('include_media', False),
-            limit=processed.get('limit')
-        )
-    else:
-        # No season or week filters
-        query = GET_ALL_GAMES_QUERY
-        variables = build_query_variables(
-            includeBettingLines=processed.get('include_betting_lines', False),
-            includeWeather=processed.get('include_weather', False),
-            includeMedia=processed.get('include_media', False),
-            limit=processed.get('limit')
-        )
+    # No season or week filters: scanning every game is rarely intended
+    if season is None and week is None and not args.allow_unbounded:
+        return json_utils.dumps({"error": "Provide a season, week, or team filter (or set allow_unbounded=true)"})
     
-    # Execute the GraphQL query
-    result = await execute_graphql(query, variables)
+    variables = {**include_flags, 'where': where, 'limit': limit_int}
     
     # Add game statistics if requested
+    analysis = None
     if calculate_stats_bool:
-        try:
-            # Import game utilities
-            import sys
-            import os
-            sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-            from utils.game_utils import calculate_game_stats_from_graphql
-            
-            # Calculate game statistics
-            game_stats = calculate_game_stats_from_graphql(result, "comprehensive")
-            
-            if game_stats and 'error' not in game_stats:
-                # Parse the result to add game statistics
-                import json
-                result_data = json.loads(result)
-                result_data['game_statistics'] = game_stats
-                result = json.dumps(result_data, indent=2)
-            elif game_stats and 'error' in game_stats:
-                # Add error info but don't fail the whole query
-                result_data = json.loads(result)
-                result_data['game_statistics_error'] = game_stats['error']
-                result = json.dumps(result_data, indent=2)
-                
-        except Exception:
-            # Don't fail the main query if statistics calculation fails
-            pass
+        analysis = ('game_statistics', lambda data: calculate_game_stats_from_graphql(data, "comprehensive"))
     
-    # Format response based on include_raw_data flag
-    if include_raw_data_bool:
-        return result
-    else:
-        return safe_format_response(result, 'games', include_raw_data_bool)
+    return await _games_response(GET_GAMES_QUERY, variables, include_raw_data_bool,
+                                 season=season, analysis=analysis)
 
 @mcp.tool()
 async def GetGamesByWeek(
     season: Annotated[Union[str, int], "Season year"],
     week: Annotated[Union[str, int], "Week number (1-15 for regular season)"],
     season_type: Annotated[Optional[str], "Season type filter ('regular', 'postseason', or None for both)"] = None,
-    limit: Annotated[Optional[Union[str, int]], "Maximum number of games to return"] = None,
+    limit: Annotated[Optional[Union[str, int]], "Maximum number of games to return (max 500)"] = None,
     calculate_weekly_trends: Annotated[Union[str, bool], "Calculate weekly betting and scoring trends"] = False,
     include_raw_data: Annotated[Union[str, bool], "Include raw GraphQL response data"] = False
 ) -> str:
@@ -238,89 +234,49 @@ async def GetGamesByWeek(
         season: Season year (e.g., 2024 or "2024")
         week: Week number (1-15 for regular season, can be string or int)
         season_type: Season type filter ("regular", "postseason", or None for both)
-        limit: Maximum number of games to return (can be string or int)
+        limit: Maximum number of games to return (can be string or int, max 500)
         calculate_weekly_trends: Calculate weekly betting and scoring trends (default: false)
         include_raw_data: Include raw GraphQL response data (default: false)
     
     Returns:
         JSON string with games for the specified week, optionally enhanced with weekly trends
     """
-    # Convert string inputs to appropriate types
-    season_int = safe_int_conversion(season, 'season')
-    week_int = safe_int_conversion(week, 'week')
-    limit_int = safe_int_conversion(limit, 'limit') if limit is not None else None
-    calculate_weekly_trends_bool = safe_bool_conversion(calculate_weekly_trends, 'calculate_weekly_trends')
-    include_raw_data_bool = safe_bool_conversion(include_raw_data, 'include_raw_data')
-    
-    # Process season_type parameter
-    season_type_processed = None
-    if season_type is not None:
-        season_type_cleaned = safe_string_conversion(season_type, 'season_type')
-        if season_type_cleaned and season_type_cleaned.lower() not in ['regular', 'postseason']:
-            raise ValueError(f"season_type must be 'regular' or 'postseason', got '{season_type_cleaned}'")
-        season_type_processed = season_type_cleaned.lower() if season_type_cleaned else None
-    
-    variables = build_query_variables(season=season_int, week=week_int, limit=limit_int)
-    
-    # Execute the GraphQL query
-    result = await execute_graphql(GET_GAMES_BY_WEEK_QUERY, variables)
+    # Validate and coerce parameters in one pass
+    args = GamesByWeekArgs.from_tool_args(
+        season=season,
+        week=week,
+        season_type=season_type,
+        limit=limit,
+        calculate_weekly_trends=calculate_weekly_trends,
+        include_raw_data=include_raw_data
+    )
+    season_int = args.season
+    week_int = args.week
+    limit_int = args.limit
+    calculate_weekly_trends_bool = args.calculate_weekly_trends
+    include_raw_data_bool = args.include_raw_data
+    season_type_processed = args.season_type
     
-    # Apply client-side seasonType filtering if specified
-    if season_type_processed is not None:
-        try:
-            import json
-            result_data = json.loads(result)
-            if 'data' in result_data and 'game' in result_data['data']:
-                filtered_games = [
-                    game for game in result_data['data']['game'] 
-                    if game.get('seasonType') == season_type_processed
-                ]
-                result_data['data']['game'] = filtered_games
-                result = json.dumps(result_data, indent=2)
-        except Exception:
-            # Don't fail the main query if filtering fails
-            pass
+    # Same document as GetGames; season type is filtered server-side
+    variables = {
+        'where': _games_where(season_int, week_int, season_type_processed),
+        'limit': limit_int
+    }
     
     # Add weekly trends analysis if requested
+    analysis = None
     if calculate_weekly_trends_bool:
-        try:
-            # Import game utilities
-            import sys
-            import os
-            sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-            from utils.game_utils import calculate_game_stats_from_graphql
-            
-            # Calculate weekly trends
-            weekly_trends = calculate_game_stats_from_graphql(result, "weekly")
-            
-            if weekly_trends and 'error' not in weekly_trends:
-                # Parse the result to add weekly trends
-                import json
-                result_data = json.loads(result)
-                result_data['weekly_trends'] = weekly_trends
-                result = json.dumps(result_data, indent=2)
-            elif weekly_trends and 'error' in weekly_trends:
-                # Add error info but don't fail the whole query
-                result_data = json.loads(result)
-                result_data['weekly_trends_error'] = weekly_trends['error']
-                result = json.dumps(result_data, indent=2)
-                
-        except Exception:
-            # Don't fail the main query if trends calculation fails
-            pass
+        analysis = ('weekly_trends', lambda data: calculate_game_stats_from_graphql(data, "weekly"))
     
-    # Format response based on include_raw_data flag
-    if include_raw_data_bool:
-        return result
-    else:
-        return safe_format_response(result, 'games', include_raw_data_bool)
+    return await _games_response(GET_GAMES_QUERY, variables, include_raw_data_bool,
+                                 season=season_int, analysis=analysis)
 
 @mcp.tool()
 async def GetTeamGames(
     team: Annotated[str, "Team name, abbreviation, or ID (e.g., 'Alabama', 'BAMA', '333')"],
     season: Annotated[Optional[Union[str, int]], "Season year"] = None,
     season_type: Annotated[Optional[str], "Season type filter ('regular', 'postseason', or None for both)"] = None,
-    limit: Annotated[Optional[Union[str, int]], "Maximum number of games to return"] = None,
+    limit: Annotated[Optional[Union[str, int]], "Maximum number of games to return (max 500)"] = None,
     calculate_performance: Annotated[Union[str, bool], "Calculate team performance metrics"] = False,
     include_raw_data: Annotated[Union[str, bool], "Include raw GraphQL response data"] = False
 ) -> str:
@@ -331,114 +287,59 @@ async def GetTeamGames(
         team: Team name, abbreviation, or ID (e.g., "Alabama", "BAMA", "333")
         season: Season year (optional, can be string or int)
         season_type: Season type filter ("regular", "postseason", or None for both)
-        limit: Maximum number of games to return (can be string or int)
+        limit: Maximum number of games to return (can be string or int, max 500)
         calculate_performance: Calculate team performance metrics (default: false)
         include_raw_data: Include raw GraphQL response data (default: false)
     
     Returns:
         JSON string with team's games, optionally enhanced with performance analysis
     """
-    # Convert string inputs to appropriate types and resolve team
-    from utils.team_resolver import resolve_team_id
+    # Validate and coerce parameters in one pass, then resolve team
+    args = TeamGamesArgs.from_tool_args(
+        season=season,
+        season_type=season_type,
+        limit=limit,
+        calculate_performance=calculate_performance,
+        include_raw_data=include_raw_data
+    )
     team_id_int = await resolve_team_id(team)
-    season_int = safe_int_conversion(season, 'season') if season is not None else None
-    limit_int = safe_int_conversion(limit, 'limit') if limit is not None else None
-    calculate_performance_bool = safe_bool_conversion(calculate_performance, 'calculate_performance')
-    include_raw_data_bool = safe_bool_conversion(include_raw_data, 'include_raw_data')
+    season_int = args.season
+    limit_int = args.limit
+    calculate_performance_bool = args.calculate_performance
+    include_raw_data_bool = args.include_raw_data
+    season_type_processed = args.season_type
     
-    # Process season_type parameter
-    season_type_processed = None
-    if season_type is not None:
-        season_type_cleaned = safe_string_conversion(season_type, 'season_type')
-        if season_type_cleaned and season_type_cleaned.lower() not in ['regular', 'postseason']:
-            raise ValueError(f"season_type must be 'regular' or 'postseason', got '{season_type_cleaned}'")
-        season_type_processed = season_type_cleaned.lower() if season_type_cleaned else None
-    
-    # Select appropriate query based on whether season is provided
-    if season_int is not None:
-        query = GET_TEAM_GAMES_WITH_SEASON_QUERY
-        variables = build_query_variables(teamId=team_id_int, season=season_int, limit=limit_int)
-    else:
-        query = GET_TEAM_GAMES_QUERY
-        variables = build_query_variables(teamId=team_id_int, limit=limit_int)
-    
-    # Execute the GraphQL query
-    result = await execute_graphql(query, variables)
-    
-    # Apply client-side seasonType filtering if specified
-    if season_type_processed is not None:
-        try:
-            import json
-            result_data = json.loads(result)
-            if 'data' in result_data and 'game' in result_data['data']:
-                filtered_games = [
-                    game for game in result_data['data']['game'] 
-                    if game.get('seasonType') == season_type_processed
-                ]
-                result_data['data']['game'] = filtered_games
-                result = json.dumps(result_data, indent=2)
-        except Exception:
-            # Don't fail the main query if filtering fails
-            pass
+    # Season and season type filters are applied server-side
+    variables = {
+        'where': _games_where(season_int, None, season_type_processed, team_id=team_id_int),
+        'limit': limit_int
+    }
     
     # Add team performance analysis if requested
+    analysis = None
     if calculate_performance_bool:
-        try:
-            # Import team utilities
-            import sys
-            import os
-            sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-            from utils.team_utils import calculate_team_performance_from_graphql
-            
-            # Calculate team performance
-            team_performance = calculate_team_performance_from_graphql(result, team_id_int)
-            
-            if team_performance and 'error' not in team_performance:
-                # Parse the result to add team performance analysis
-                import json
-                result_data = json.loads(result)
-                result_data['team_performance'] = team_performance
-                result = json.dumps(result_data, indent=2)
-            elif team_performance and 'error' in team_performance:
-                # Add error info but don't fail the whole query
-                result_data = json.loads(result)
-                result_data['team_performance_error'] = team_performance['error']
-                result = json.dumps(result_data, indent=2)
-                
-        except Exception:
-            # Don't fail the main query if performance analysis fails
-            pass
+        analysis = ('team_performance', lambda data: calculate_team_performance_from_graphql(data, team_id_int))
     
-    # Format response based on include_raw_data flag
-    if include_raw_data_bool:
-        return result
-    else:
-        return safe_format_response(result, 'games', include_raw_data_bool)
+    return await _games_response(GET_TEAM_GAMES_QUERY, variables, include_raw_data_bool,
+                                 season=season_int, analysis=analysis)
 
 @mcp.tool()
 async def GetRecentGames(
-    limit: Annotated[Optional[Union[str, int]], "Maximum number of recent games to return"] = 20,
+    limit: Annotated[Optional[Union[str, int]], "Maximum number of recent games to return (max 500)"] = 20,
     include_raw_data: Annotated[Union[str, bool], "Include raw GraphQL response data"] = False
 ) -> str:
     """
     Get recently completed games.
     
     Args:
-        limit: Maximum number of recent games to return (default: 20, can be string or int)
+        limit: Maximum number of recent games to return (default: 20, can be string or int, max 500)
         include_raw_data: Include raw GraphQL response data (default: false)
     
     Returns:
         JSON string with recently completed games
     """
-    # Convert string input to integer
-    limit_int = safe_int_conversion(limit, 'limit') if limit is not None else 20
-    include_raw_data_bool = safe_bool_conversion(include_raw_data, 'include_raw_data')
-    
-    variables = build_query_variables(limit=limit_int)
-    result = await execute_graphql(GET_RECENT_GAMES_QUERY, variables)
+    args = RecentGamesArgs.from_tool_args(limit=limit, include_raw_data=include_raw_data)
+    limit_int = args.limit
+    include_raw_data_bool = args.include_raw_data
     
-    # Format response based on include_raw_data flag
-    if include_raw_data_bool:
-        return result
-    else:
-        return safe_format_response(result, 'games', include_raw_data_bool)
\ No newline at end of file
+    return await _games_response(GET_RECENT_GAMES_QUERY, {'limit': limit_int}, include_raw_data_bool)
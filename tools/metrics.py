@@ -5,16 +5,25 @@ Advanced metrics MCP tools for college football data.
 from typing import Optional, Union, Annotated
 
 # Import from server module at package level
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from mcp_instance import mcp
-from src.graphql_executor import execute_graphql
-from utils.param_utils import safe_int_conversion, safe_bool_conversion
-from utils.graphql_utils import build_query_variables
+from src.graphql import precompute_query_encodings, validate_query_documents
+from src.models import MetricsArgs
+from utils import json_utils
+from utils.graphql_utils import build_query_variables, minify_query
+from utils.query_cache import cached_execute_graphql
 from utils.response_formatter import safe_format_response
 from utils.team_resolver import resolve_optional_team_id
 from queries.metrics import GET_ADVANCED_METRICS_QUERY
+
+# Sent minified, with the request encoding and APQ hash computed (and the
+# document optionally validated) once at import
+GET_ADVANCED_METRICS_QUERY = minify_query(GET_ADVANCED_METRICS_QUERY)
+_METRICS_QUERIES = (GET_ADVANCED_METRICS_QUERY,)
+
+precompute_query_encodings(_METRICS_QUERIES)
+validate_query_documents(_METRICS_QUERIES)
+
+
 @mcp.tool()
 async def GetAdvancedMetrics(
     team: Annotated[Optional[str], "Team name, abbreviation, or ID (e.g., 'Alabama', 'BAMA', '333')"] = None,
@@ -32,16 +41,17 @@ async def GetAdvancedMetrics(
         JSON string with advanced metrics data
         include_raw_data: Include raw GraphQL response data (default: false)
     """
-    # Convert string inputs to integers and resolve team
+    # Validate and coerce parameters in one pass, then resolve team
+    args = MetricsArgs.from_tool_args(season=season, include_raw_data=include_raw_data)
     team_id_int = await resolve_optional_team_id(team)
-    season_int = safe_int_conversion(season, 'season') if season is not None else None
-    include_raw_data_bool = safe_bool_conversion(include_raw_data, 'include_raw_data')
+    season_int = args.season
+    include_raw_data_bool = args.include_raw_data
     
     variables = build_query_variables(teamId=team_id_int, season=season_int)
-    result = await execute_graphql(GET_ADVANCED_METRICS_QUERY, variables)
+    result = await cached_execute_graphql(GET_ADVANCED_METRICS_QUERY, variables, return_raw_dict=True)
     
     # Format response based on include_raw_data flag
     if include_raw_data_bool:
-        return result
+        return json_utils.dumps(result)
     else:
         return safe_format_response(result, 'metrics', include_raw_data_bool)
\ No newline at end of file
@@ -2,37 +2,42 @@
 Rankings-related MCP tools for college football data.
 """
 
-import json
-import sys
-import os
-from typing import Optional, Union, Annotated
+from typing import Any, Dict, Optional, Tuple, Union, Annotated
 
 # Import from server module at package level
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from mcp_instance import mcp
-from src.graphql_executor import execute_graphql  
-from utils.param_utils import preprocess_ranking_params, safe_int_conversion, safe_bool_conversion
-from utils.graphql_utils import build_query_variables
+from src.graphql import precompute_query_encodings, validate_query_documents
+from utils import json_utils
+from src.models import RankingsArgs
+from utils.param_utils import preprocess_ranking_params
+from utils.graphql_utils import build_query_variables, minify_query
+from utils.query_cache import cached_execute_graphql
 from utils.response_formatter import safe_format_response
-from queries.rankings import build_rankings_query
+from queries.rankings import GET_LATEST_WEEK_QUERY, build_rankings_query
+
+# Sent minified, with the request encoding and APQ hash computed (and the
+# document optionally validated) once at import
+GET_LATEST_WEEK_QUERY = minify_query(GET_LATEST_WEEK_QUERY)
+_RANKINGS_QUERIES = (GET_LATEST_WEEK_QUERY,)
+
+precompute_query_encodings(_RANKINGS_QUERIES)
+validate_query_documents(_RANKINGS_QUERIES)
+
+
+def _build_rankings_query(**kwargs) -> Tuple[str, Dict[str, Any]]:
+    """
+    Build a rankings query (see build_rankings_query), minified like the
+    static documents. Its encodings are cached per distinct document on
+    first use, as the filters and top_n shape the text.
+    """
+    query, variables = build_rankings_query(**kwargs)
+    return minify_query(query), variables
 
 
 async def get_latest_week(season: int) -> Optional[int]:
     """Get the latest week with ranking data for a given season."""
     try:
-        query = """
-        query GetLatestWeekForSeason($season: Int!) {
-            poll(
-                where: { season: { _eq: $season } }
-                orderBy: { week: DESC }
-                limit: 1
-            ) {
-                week
-            }
-        }
-        """
-        result = await execute_graphql(query, {"season": season})
-        data = json.loads(result)
+        data = await cached_execute_graphql(GET_LATEST_WEEK_QUERY, {"season": season}, return_raw_dict=True)
         
         if data.get("data", {}).get("poll") and len(data["data"]["poll"]) > 0:
             return data["data"]["poll"][0]["week"]
@@ -76,12 +81,20 @@ async def GetRankings(
     Returns:
         YAML formatted rankings data, optimized for single poll or team search
     """
-    # Convert string inputs to appropriate types
-    season_int = safe_int_conversion(season, 'season') if season is not None else None
-    week_int = safe_int_conversion(week, 'week') if week is not None else None
-    top_n_int = safe_int_conversion(top_n, 'top_n') if top_n is not None else 25
-    movement_bool = safe_bool_conversion(movement, 'movement') or safe_bool_conversion(calculate_movement, 'calculate_movement')
-    include_raw_data_bool = safe_bool_conversion(include_raw_data, 'include_raw_data')
+    # Validate and coerce parameters in one pass
+    args = RankingsArgs.from_tool_args(
+        season=season,
+        week=week,
+        top_n=top_n,
+        movement=movement,
+        calculate_movement=calculate_movement,
+        include_raw_data=include_raw_data
+    )
+    season_int = args.season
+    week_int = args.week
+    top_n_int = args.top_n
+    movement_bool = args.movement or args.calculate_movement
+    include_raw_data_bool = args.include_raw_data
     
     # Apply smart defaults
     if season_int is None and week_int is None:
@@ -92,7 +105,7 @@ async def GetRankings(
         week_int = await get_latest_week(season_int) or 15
     
     # Build dynamic query and variables
-    query, variables = build_rankings_query(
+    query, variables = _build_rankings_query(
         season=season_int, 
         week=week_int, 
         poll_type=poll_type,
@@ -101,26 +114,23 @@ async def GetRankings(
     )
     
     # Execute the GraphQL query
-    result = await execute_graphql(query, variables)
+    result = await cached_execute_graphql(query, variables, return_raw_dict=True)
     
     # Add ranking movement analysis if requested
     if movement_bool and week_int and week_int > 1:
         try:
             # Get previous week's rankings for comparison
-            prev_query, prev_variables = build_rankings_query(
+            prev_query, prev_variables = _build_rankings_query(
                 season=season_int, 
                 week=week_int-1, 
                 poll_type=poll_type,
                 team=team,
                 top_n=top_n_int
             )
-            prev_result = await execute_graphql(prev_query, prev_variables)
+            prev_data = await cached_execute_graphql(prev_query, prev_variables, return_raw_dict=True)
             
-            # Add movement data to current result
-            result_data = json.loads(result)
-            prev_data = json.loads(prev_result)
-            result_data['previous_week_data'] = prev_data.get('data', {})
-            result = json.dumps(result_data, indent=2)
+            # Add movement data to a copy of the current result
+            result = {**result, 'previous_week_data': prev_data.get('data', {})}
                 
         except Exception:
             # Don't fail the main query if movement analysis fails
@@ -128,7 +138,7 @@ async def GetRankings(
     
     # Format response based on include_raw_data flag
     if include_raw_data_bool:
-        return result
+        return json_utils.dumps(result)
     else:
         return safe_format_response(result, 'rankings', include_raw_data_bool, {
             'poll_type': poll_type,
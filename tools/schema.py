@@ -10,8 +10,6 @@ from typing import Optional, Dict, List, Any, Tuple, Union, Annotated
 from pathlib import Path
 
 # Import from dedicated mcp module
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from mcp_instance import mcp
 from utils.param_utils import safe_int_conversion, safe_bool_conversion
 
@@ -5,12 +5,21 @@ Search and discovery MCP tools for college football data.
 from typing import Optional, Annotated
 
 # Import from server module at package level
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from mcp_instance import mcp
+from src.graphql import precompute_query_encodings, validate_query_documents
 from src.graphql_executor import execute_graphql, build_query_variables
+from utils.graphql_utils import minify_query
 from queries.search import SEARCH_ENTITIES_QUERY
+
+# Sent minified, with the request encoding and APQ hash computed (and the
+# document optionally validated) once at import
+SEARCH_ENTITIES_QUERY = minify_query(SEARCH_ENTITIES_QUERY)
+_SEARCH_QUERIES = (SEARCH_ENTITIES_QUERY,)
+
+precompute_query_encodings(_SEARCH_QUERIES)
+validate_query_documents(_SEARCH_QUERIES)
+
+
 @mcp.tool()
 async def SearchEntities(
     search_term: Annotated[str, "Text to search for across teams, players, and coaches"]
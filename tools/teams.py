@@ -7,14 +7,14 @@ Consolidated team tools with flexible filtering and optional enhancements.
 from typing import Optional, Union, Annotated
 
 # Import from dedicated mcp module to avoid circular imports
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from mcp_instance import mcp
+from src.graphql import precompute_query_encodings, validate_query_documents
 from src.graphql_executor import execute_graphql
+from utils import json_utils
 from utils.param_utils import preprocess_team_params, validate_team_lookup_params, safe_int_conversion, safe_string_conversion, safe_bool_conversion
-from utils.graphql_utils import build_query_variables, format_search_pattern
+from utils.graphql_utils import build_query_variables, format_search_pattern, minify_query
 from utils.response_formatter import safe_format_response
+from utils.team_resolver import resolve_team_id
 from queries.teams import (
     GET_TEAMS_QUERY,
     GET_TEAMS_ALL_QUERY,
@@ -28,6 +28,32 @@ from queries.teams import (
     GET_TEAM_WITH_RATINGS_QUERY
 )
 
+# Documents the team tools send, minified with their request encodings and
+# APQ hashes computed (and optionally validated) once at import
+GET_TEAMS_ALL_QUERY = minify_query(GET_TEAMS_ALL_QUERY)
+GET_TEAMS_BY_CONFERENCE_QUERY = minify_query(GET_TEAMS_BY_CONFERENCE_QUERY)
+GET_TEAMS_BY_DIVISION_QUERY = minify_query(GET_TEAMS_BY_DIVISION_QUERY)
+SEARCH_TEAMS_QUERY = minify_query(SEARCH_TEAMS_QUERY)
+GET_TEAM_DETAILS_QUERY_BY_ID = minify_query(GET_TEAM_DETAILS_QUERY_BY_ID)
+GET_TEAM_DETAILS_QUERY_BY_NAME = minify_query(GET_TEAM_DETAILS_QUERY_BY_NAME)
+GET_TEAM_RATINGS_QUERY = minify_query(GET_TEAM_RATINGS_QUERY)
+GET_TEAM_TALENT_QUERY = minify_query(GET_TEAM_TALENT_QUERY)
+
+_TEAM_QUERIES = (
+    GET_TEAMS_ALL_QUERY,
+    GET_TEAMS_BY_CONFERENCE_QUERY,
+    GET_TEAMS_BY_DIVISION_QUERY,
+    SEARCH_TEAMS_QUERY,
+    GET_TEAM_DETAILS_QUERY_BY_ID,
+    GET_TEAM_DETAILS_QUERY_BY_NAME,
+    GET_TEAM_RATINGS_QUERY,
+    GET_TEAM_TALENT_QUERY
+)
+
+precompute_query_encodings(_TEAM_QUERIES)
+validate_query_documents(_TEAM_QUERIES)
+
+
 @mcp.tool()
 async def GetTeams(
     conference: Annotated[Optional[str], "Conference name filter (e.g., 'ACC', 'SEC', 'Big 12')"] = None,
@@ -220,8 +246,6 @@ async def GetTeamRatings(
     Returns:
         YAML formatted team ratings with predictive analytics context
     """
-    from utils.team_resolver import resolve_team_id
-    
     # Process parameters
     season_int = safe_int_conversion(season, 'season') if season is not None else 2024
     include_talent_bool = safe_bool_conversion(include_talent, 'include_talent')
@@ -239,14 +263,7 @@ async def GetTeamRatings(
     
     # Get team ratings
     variables = build_query_variables(teamId=team_id, season=season_int)
-    ratings_result = await execute_graphql(GET_TEAM_RATINGS_QUERY, variables)
-    
-    # Parse JSON result
-    import json
-    try:
-        ratings_data = json.loads(ratings_result) if isinstance(ratings_result, str) else ratings_result
-    except (json.JSONDecodeError, TypeError):
-        ratings_data = {"data": {"ratings": []}}
+    ratings_data = await execute_graphql(GET_TEAM_RATINGS_QUERY, variables, return_raw_dict=True)
     
     combined_result = {
         "team_id": team_id,
@@ -256,19 +273,11 @@ async def GetTeamRatings(
     
     # Get team talent if requested
     if include_talent_bool:
-        talent_result = await execute_graphql(GET_TEAM_TALENT_QUERY, variables)
-        try:
-            talent_data = json.loads(talent_result) if isinstance(talent_result, str) else talent_result
-        except (json.JSONDecodeError, TypeError):
-            talent_data = {"data": {"teamTalent": []}}
+        talent_data = await execute_graphql(GET_TEAM_TALENT_QUERY, variables, return_raw_dict=True)
         combined_result["talent"] = talent_data.get("data", {}).get("teamTalent", [])
     
     # Format response based on include_raw_data flag
     if include_raw_data_bool:
-        import json
-        return json.dumps(combined_result, indent=2)
+        return json_utils.dumps(combined_result, pretty=True)
     else:
-        # Convert to JSON string for formatter
-        import json
-        json_result = json.dumps({"data": {"team_ratings": combined_result}})
-        return safe_format_response(json_result, 'team_ratings', include_raw_data_bool)
\ No newline at end of file
+        return safe_format_response({"data": {"team_ratings": combined_result}}, 'team_ratings', include_raw_data_bool)
\ No newline at end of file
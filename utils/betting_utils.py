@@ -5,8 +5,9 @@ Simple, pure functions to calculate ATS, O/U, and other betting outcomes
 from GraphQL query results.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
-import json
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+from utils import json_utils
 
 
 def calculate_ats_outcome(
@@ -110,213 +111,184 @@ def calculate_su_outcome(
     return team_points > opponent_points
 
 
-def calculate_team_betting_record(
-    games: List[Dict[str, Any]], 
-    team_name: str
-) -> Dict[str, Any]:
+def _parse_betting_game(
+    game: Dict[str, Any],
+    team_lower: str
+) -> Optional[Tuple[bool, float, float, float, Optional[float]]]:
     """
-    Calculate complete betting record for a team from game data.
+    Extract the fields needed for betting outcomes from a completed game.
     
     Args:
-        games: List of game dictionaries from GraphQL query
-        team_name: Name of team to analyze
+        game: Game dictionary from GraphQL query
+        team_lower: Lowercased name of team being analyzed
         
     Returns:
-        Dictionary with ATS, O/U, and SU records
+        Tuple of (is_home_team, home_points, away_points, spread, over_under),
+        or None if the game has no final score or spread
     """
-    ats_wins = 0
-    ou_overs = 0
-    su_wins = 0
-    total_games = 0
-    
-    for game in games:
-        # Skip games without complete data
-        if not all([
-            game.get('homePoints') is not None,
-            game.get('awayPoints') is not None,
-            game.get('lines') and len(game['lines']) > 0,
-            game['lines'][0].get('spread') is not None
-        ]):
-            continue
-            
-        home_points = safe_numeric_conversion(game['homePoints'])
-        away_points = safe_numeric_conversion(game['awayPoints'])
-        home_team = game.get('homeTeam', '')
-        away_team = game.get('awayTeam', '')
-        
-        # Get betting lines (use first line if multiple)
-        line = game['lines'][0]
-        spread = safe_numeric_conversion(line['spread'])
-        over_under = safe_numeric_conversion(line.get('overUnder'))
-        
-        total_games += 1
-        
-        # Calculate ATS outcome
-        if calculate_ats_outcome(home_points, away_points, spread, team_name, home_team, away_team):
-            ats_wins += 1
-            
-        # Calculate O/U outcome  
-        if over_under and calculate_ou_outcome(home_points, away_points, over_under):
-            ou_overs += 1
-            
-        # Calculate SU outcome - use same matching logic as ATS
-        team_lower = team_name.lower()
-        is_home_team = team_lower in home_team.lower() or home_team.lower() in team_lower
-        
-        if is_home_team:
-            team_points, opponent_points = home_points, away_points
-        else:
-            team_points, opponent_points = away_points, home_points
-            
-        if calculate_su_outcome(team_points, opponent_points):
-            su_wins += 1
+    home_points = game.get('homePoints')
+    away_points = game.get('awayPoints')
+    lines = game.get('lines')
+    if home_points is None or away_points is None or not lines:
+        return None
     
-    # Format records as strings
-    ats_record = f"{ats_wins}-{total_games - ats_wins}" if total_games > 0 else "0-0"
-    ou_record = f"{ou_overs}-{total_games - ou_overs}" if total_games > 0 else "0-0"
-    su_record = f"{su_wins}-{total_games - su_wins}" if total_games > 0 else "0-0"
+    line = lines[0]
+    spread = safe_numeric_conversion(line.get('spread'))
+    if spread is None:
+        return None
     
-    return {
-        "ats": ats_record,
-        "ou": ou_record, 
-        "su": su_record,
-        "total_games": total_games,
-        "ats_percentage": round(ats_wins / total_games * 100, 1) if total_games > 0 else 0.0,
-        "ou_percentage": round(ou_overs / total_games * 100, 1) if total_games > 0 else 0.0,
-        "su_percentage": round(su_wins / total_games * 100, 1) if total_games > 0 else 0.0
-    }
+    # Better team name matching - check if team name is contained in either team name
+    home_team = (game.get('homeTeam') or '').lower()
+    is_home_team = team_lower in home_team or home_team in team_lower
+    
+    return (
+        is_home_team,
+        safe_numeric_conversion(home_points),
+        safe_numeric_conversion(away_points),
+        spread,
+        safe_numeric_conversion(line.get('overUnder'))
+    )
+
 
+def _ats_covered(is_home_team: bool, margin: float, spread: float) -> bool:
+    """Cover check on a home-perspective margin, with the same rules as calculate_ats_outcome."""
+    if is_home_team:
+        return margin > abs(spread) if spread < 0 else margin > -spread
+    return -margin < abs(spread) if spread < 0 else -margin > spread
 
-def calculate_weekly_betting_trends(games: List[Dict[str, Any]]) -> Dict[str, Any]:
+
+class BettingRecord:
     """
-    Calculate betting trends for a week of games.
+    ATS, O/U, and SU record accumulated one game at a time.
     
-    Args:
-        games: List of game dictionaries from GraphQL query
-        
-    Returns:
-        Dictionary with weekly betting statistics
+    Lets several analyses share a single pass over the games; adding every
+    game gives the same record as calculate_team_betting_record.
     """
-    favorites_covered = 0
-    overs_hit = 0
-    total_games = 0
     
-    for game in games:
-        # Skip games without complete data
-        if not all([
-            game.get('homePoints') is not None,
-            game.get('awayPoints') is not None,
-            game.get('lines') and len(game['lines']) > 0
-        ]):
-            continue
-            
-        home_points = safe_numeric_conversion(game['homePoints'])
-        away_points = safe_numeric_conversion(game['awayPoints'])
-        line = game['lines'][0]
-        spread = safe_numeric_conversion(line.get('spread'))
-        over_under = safe_numeric_conversion(line.get('overUnder'))
+    __slots__ = ('ats_wins', 'ou_overs', 'su_wins', 'total_games')
+    
+    def __init__(self):
+        self.ats_wins = 0
+        self.ou_overs = 0
+        self.su_wins = 0
+        self.total_games = 0
+    
+    def add(self, parsed_game: Tuple[bool, float, float, float, Optional[float]]) -> None:
+        """Add a game already parsed by _parse_betting_game."""
+        is_home_team, home_points, away_points, spread, over_under = parsed_game
+        margin = home_points - away_points  # Positive = home team won by this margin
         
-        if spread is None:
-            continue
-            
-        total_games += 1
+        self.total_games += 1
         
-        # Check if favorite covered (spread > 0 means home favored)
-        margin = home_points - away_points
-        if spread > 0:  # Home team favored
-            favorite_covered = margin > spread
-        else:  # Away team favored  
-            favorite_covered = margin < spread
-            
-        if favorite_covered:
-            favorites_covered += 1
-            
-        # Check over/under
-        if over_under and calculate_ou_outcome(home_points, away_points, over_under):
-            overs_hit += 1
+        if _ats_covered(is_home_team, margin, spread):
+            self.ats_wins += 1
+        
+        if over_under and home_points + away_points > over_under:
+            self.ou_overs += 1
+        
+        if (margin if is_home_team else -margin) > 0:
+            self.su_wins += 1
     
-    return {
-        "total_games": total_games,
-        "favorites_covered": favorites_covered,
-        "favorites_percentage": round(favorites_covered / total_games * 100, 1) if total_games > 0 else 0.0,
-        "overs_hit": overs_hit, 
-        "overs_percentage": round(overs_hit / total_games * 100, 1) if total_games > 0 else 0.0,
-        "unders_hit": total_games - overs_hit,
-        "unders_percentage": round((total_games - overs_hit) / total_games * 100, 1) if total_games > 0 else 0.0
-    }
+    def as_dict(self) -> Dict[str, Any]:
+        """Format the record the way calculate_team_betting_record does."""
+        total_games = self.total_games
+        ats_wins, ou_overs, su_wins = self.ats_wins, self.ou_overs, self.su_wins
+        
+        # Format records as strings
+        ats_record = f"{ats_wins}-{total_games - ats_wins}" if total_games > 0 else "0-0"
+        ou_record = f"{ou_overs}-{total_games - ou_overs}" if total_games > 0 else "0-0"
+        su_record = f"{su_wins}-{total_games - su_wins}" if total_games > 0 else "0-0"
+        
+        return {
+            "ats": ats_record,
+            "ou": ou_record, 
+            "su": su_record,
+            "total_games": total_games,
+            "ats_percentage": round(ats_wins / total_games * 100, 1) if total_games > 0 else 0.0,
+            "ou_percentage": round(ou_overs / total_games * 100, 1) if total_games > 0 else 0.0,
+            "su_percentage": round(su_wins / total_games * 100, 1) if total_games > 0 else 0.0
+        }
 
 
-def analyze_spread_ranges(games: List[Dict[str, Any]], team_name: str) -> Dict[str, Any]:
+def calculate_team_betting_record(
+    games: List[Dict[str, Any]], 
+    team_name: str
+) -> Dict[str, Any]:
     """
-    Analyze team performance at different spread levels.
+    Calculate complete betting record for a team from game data.
     
     Args:
         games: List of game dictionaries from GraphQL query
         team_name: Name of team to analyze
         
     Returns:
-        Dictionary with performance breakdown by spread range
+        Dictionary with ATS, O/U, and SU records
     """
-    # Define spread ranges with clear labels
-    range_definitions = [
-        ("heavy_underdog", 14.5, float('inf'), "14.5+ underdog"),
-        ("underdog", 3.5, 14.4, "3.5-14.4 underdog"),
-        ("slight_underdog", 0.1, 3.4, "0.1-3.4 underdog"),
-        ("pick_em", -0.1, 0.1, "Pick'em"),
-        ("slight_favorite", -3.4, -0.1, "0.1-3.4 favorite"),
-        ("favorite", -14.4, -3.5, "3.5-14.4 favorite"),
-        ("heavy_favorite", -float('inf'), -14.5, "14.5+ favorite")
-    ]
+    team_lower = team_name.lower()
+    record = BettingRecord()
     
-    range_performance = {}
+    for game in games:
+        # Skip games without complete data
+        parsed_game = _parse_betting_game(game, team_lower)
+        if parsed_game is not None:
+            record.add(parsed_game)
     
-    for range_key, min_spread, max_spread, display_name in range_definitions:
-        range_games = []
+    return record.as_dict()
+
+
+# Spread ranges from the team's perspective (positive = underdog)
+SPREAD_RANGES = [
+    ("heavy_underdog", 14.5, float('inf'), "14.5+ underdog"),
+    ("underdog", 3.5, 14.4, "3.5-14.4 underdog"),
+    ("slight_underdog", 0.1, 3.4, "0.1-3.4 underdog"),
+    ("pick_em", -0.1, 0.1, "Pick'em"),
+    ("slight_favorite", -3.4, -0.1, "0.1-3.4 favorite"),
+    ("favorite", -14.4, -3.5, "3.5-14.4 favorite"),
+    ("heavy_favorite", -float('inf'), -14.5, "14.5+ favorite")
+]
+
+
+class SpreadRangeAnalyzer:
+    """Single-pass accumulator of a team's ATS and SU records by spread range."""
+    
+    def __init__(self, team_name: str):
+        self.team_lower = team_name.lower()
+        self.records = {range_key: BettingRecord() for range_key, _, _, _ in SPREAD_RANGES}
+    
+    def update(self, game: Dict[str, Any]) -> None:
+        """Add a game to every spread range it falls in."""
+        parsed_game = _parse_betting_game(game, self.team_lower)
+        if parsed_game is not None:
+            self.add(parsed_game)
+    
+    def add(self, parsed_game: Tuple[bool, float, float, float, Optional[float]]) -> None:
+        """Add a game already parsed by _parse_betting_game."""
+        is_home_team, _, _, spread, _ = parsed_game
+        # Flip spread for away team perspective
+        team_spread = spread if is_home_team else -spread
         
-        for game in games:
-            if not all([
-                game.get('homePoints') is not None,
-                game.get('awayPoints') is not None,
-                game.get('lines') and len(game['lines']) > 0,
-                game['lines'][0].get('spread') is not None
-            ]):
-                continue
-                
-            home_team = game.get('homeTeam', '')
-            away_team = game.get('awayTeam', '')
-            line = game['lines'][0]
-            spread = safe_numeric_conversion(line['spread'])
-            
-            # Skip if spread conversion failed
-            if spread is None:
-                continue
-            
-            # Determine if team is home or away and calculate their effective spread
-            team_lower = team_name.lower()
-            is_home_team = team_lower in home_team.lower() or home_team.lower() in team_lower
-            
-            if is_home_team:
-                team_spread = spread  # Positive = underdog, negative = favorite
-            else:
-                team_spread = -spread  # Flip spread for away team perspective
-            
-            # Check if this game falls in the current range
+        for range_key, min_spread, max_spread, _ in SPREAD_RANGES:
             if min_spread <= team_spread <= max_spread:
-                range_games.append(game)
-        
-        if range_games:
-            # Calculate betting record for this range
-            range_record = calculate_team_betting_record(range_games, team_name)
-            range_performance[range_key] = {
-                "display_name": display_name,
-                "games": len(range_games),
-                "ats_record": range_record["ats"],
-                "ats_percentage": range_record["ats_percentage"],
-                "su_record": range_record["su"],
-                "su_percentage": range_record["su_percentage"]
-            }
+                self.records[range_key].add(parsed_game)
     
-    return range_performance
+    def result(self) -> Dict[str, Any]:
+        """Performance breakdown for ranges that had at least one game."""
+        range_performance = {}
+        
+        for range_key, _, _, display_name in SPREAD_RANGES:
+            record = self.records[range_key]
+            if record.total_games:
+                range_record = record.as_dict()
+                range_performance[range_key] = {
+                    "display_name": display_name,
+                    "games": record.total_games,
+                    "ats_record": range_record["ats"],
+                    "ats_percentage": range_record["ats_percentage"],
+                    "su_record": range_record["su"],
+                    "su_percentage": range_record["su_percentage"]
+                }
+        
+        return range_performance
 
 
 def analyze_head_to_head(
@@ -389,235 +361,301 @@ def analyze_head_to_head(
     }
 
 
-def filter_games_by_scenario(games: List[Dict[str, Any]], team_name: str, scenario: str) -> List[Dict[str, Any]]:
+# Scenario -> (team side column, home-perspective spread comparison).
+# Spreads are stored from the home team's perspective, so a road underdog
+# is an away game where the home team is favored (spread < 0).
+SCENARIO_FILTERS = {
+    'road_underdog': ('awayTeamId', '_lt'),
+    'home_favorite': ('homeTeamId', '_lt'),
+    'road_favorite': ('awayTeamId', '_gt'),
+    'home_underdog': ('homeTeamId', '_gt'),
+}
+
+
+def build_scenario_where(team_id: int, scenario: str, season: Optional[int] = None) -> Optional[Dict[str, Any]]:
     """
-    Filter games based on betting scenario (home/away + spread position).
-    
+    Build a GraphQL `where` expression that selects games matching a betting scenario.
+
+    Only matching games are transferred instead of filtering the team's full
+    schedule in Python. BettingTrendsAnalyzer classifies games by the same
+    rules for its scenario breakdown.
+
     Args:
-        games: List of game dictionaries from GraphQL query
-        team_name: Name of team to analyze
+        team_id: Team ID to analyze
         scenario: Scenario type - 'road_underdog', 'home_favorite', 'road_favorite', 'home_underdog'
-        
+        season: Optional season filter
+
     Returns:
-        Filtered list of games matching the scenario
+        gameBoolExp dictionary, or None if the scenario is not recognized
     """
-    if not scenario:
-        return games
-    
-    valid_scenarios = ['road_underdog', 'home_favorite', 'road_favorite', 'home_underdog']
-    if scenario not in valid_scenarios:
-        return games
-    
-    filtered_games = []
+    scenario_filter = SCENARIO_FILTERS.get(scenario)
+    if not scenario_filter:
+        return None
+
+    team_column, spread_op = scenario_filter
+    conditions = [
+        {team_column: {"_eq": team_id}},
+        {"homePoints": {"_isNull": False}},
+        {"awayPoints": {"_isNull": False}},
+        {"lines": {"spread": {spread_op: 0}}}
+    ]
+
+    if season is not None:
+        conditions.append({"season": {"_eq": season}})
+
+    return {"_and": conditions}
+
+
+def build_team_betting_where(team_id: int, season: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Build a GraphQL `where` expression selecting a team's completed games with betting lines.
     
-    for game in games:
-        # Skip games without complete data
-        if not all([
-            game.get('homePoints') is not None,
-            game.get('awayPoints') is not None,
-            game.get('lines') and len(game['lines']) > 0,
-            game['lines'][0].get('spread') is not None
-        ]):
-            continue
-            
-        # Determine if team is home or away
-        home_team = game.get('homeTeam', '')
-        team_lower = team_name.lower()
-        is_home_team = team_lower in home_team.lower() or home_team.lower() in team_lower
-        
-        # Get spread for this team
-        line = game['lines'][0]
-        spread = safe_numeric_conversion(line['spread'])
-        if spread is None:
-            continue
-            
-        # Calculate team's effective spread (positive = underdog, negative = favorite)
-        if is_home_team:
-            team_spread = spread
-        else:
-            team_spread = -spread
-        
-        # Check if game matches the scenario
-        scenario_match = False
-        
-        if scenario == "road_underdog" and not is_home_team and team_spread > 0:
-            scenario_match = True
-        elif scenario == "home_favorite" and is_home_team and team_spread < 0:
-            scenario_match = True
-        elif scenario == "road_favorite" and not is_home_team and team_spread < 0:
-            scenario_match = True
-        elif scenario == "home_underdog" and is_home_team and team_spread > 0:
-            scenario_match = True
+    Args:
+        team_id: Team ID to analyze
+        season: Optional season filter
         
-        if scenario_match:
-            filtered_games.append(game)
+    Returns:
+        gameBoolExp dictionary
+    """
+    conditions = [
+        {"_or": [{"homeTeamId": {"_eq": team_id}}, {"awayTeamId": {"_eq": team_id}}]},
+        {"homePoints": {"_isNull": False}},
+        {"awayPoints": {"_isNull": False}},
+        {"lines": {}}
+    ]
+    
+    if season is not None:
+        conditions.append({"season": {"_eq": season}})
     
-    return filtered_games
+    return {"_and": conditions}
 
 
-def analyze_betting_trends(games: List[Dict[str, Any]], team_name: str, last_n_games: int = 10) -> Dict[str, Any]:
+def build_betting_lines_where(
+    team_id: Optional[int] = None,
+    season: Optional[int] = None,
+    week: Optional[int] = None,
+    season_type: Optional[str] = None
+) -> Dict[str, Any]:
     """
-    Analyze recent betting trends for a team.
+    Build a GraphQL `where` expression selecting games with betting lines.
+    
+    Only the provided filters are included, so one query document serves
+    every combination of filters.
     
     Args:
-        games: List of game dictionaries from GraphQL query (should be ordered by date DESC)
-        team_name: Name of team to analyze
-        last_n_games: Number of recent games to analyze
+        team_id: Optional team ID (home or away)
+        season: Optional season filter
+        week: Optional week filter
+        season_type: Optional season type filter ('regular' or 'postseason')
         
     Returns:
-        Dictionary with recent betting trends including scenario breakdowns
+        gameBoolExp dictionary
     """
-    if not games:
-        return {"error": "No games provided for trend analysis"}
-    
-    # Take the most recent N games
-    recent_games = games[:last_n_games]
-    
-    # Calculate overall record for recent games
-    recent_record = calculate_team_betting_record(recent_games, team_name)
-    
-    # Calculate home vs away splits
-    home_games = []
-    away_games = []
-    
-    for game in recent_games:
-        if not all([
-            game.get('homePoints') is not None,
-            game.get('awayPoints') is not None,
-            game.get('lines') and len(game['lines']) > 0
-        ]):
-            continue
-            
-        home_team = game.get('homeTeam', '')
-        team_lower = team_name.lower()
-        is_home_team = team_lower in home_team.lower() or home_team.lower() in team_lower
+    conditions: List[Dict[str, Any]] = [{"lines": {}}]
+    
+    if team_id is not None:
+        conditions.append({"_or": [{"homeTeamId": {"_eq": team_id}}, {"awayTeamId": {"_eq": team_id}}]})
+    if season is not None:
+        conditions.append({"season": {"_eq": season}})
+    if week is not None:
+        conditions.append({"week": {"_eq": week}})
+    if season_type is not None:
+        conditions.append({"seasonType": {"_eq": season_type}})
+    
+    return {"_and": conditions}
+
+
+BETTING_SCENARIOS = ['road_underdog', 'home_favorite', 'road_favorite', 'home_underdog']
+
+
+class BettingTrendsAnalyzer:
+    """Single-pass accumulator behind analyze_betting_trends."""
+    
+    def __init__(self, team_name: str, last_n_games: int = 10):
+        self.team_lower = team_name.lower()
+        self.last_n_games = last_n_games
+        self.games_seen = 0
+        self.recent_games = 0
+        self.overall = BettingRecord()
+        self.home_games = 0
+        self.away_games = 0
+        self.home_record = BettingRecord()
+        self.away_record = BettingRecord()
+        self.scenario_records = {scenario: BettingRecord() for scenario in BETTING_SCENARIOS}
+        self.scenario_spreads = {scenario: [] for scenario in BETTING_SCENARIOS}
+    
+    def update(self, game: Dict[str, Any]) -> None:
+        """Add the next game (games should be ordered by date DESC)."""
+        self.games_seen += 1
+        if self.recent_games >= self.last_n_games:
+            return
+        self.recent_games += 1
+        
+        parsed_game = _parse_betting_game(game, self.team_lower)
+        if parsed_game is not None:
+            self.overall.add(parsed_game)
+        
+        # Home vs away splits count games with a score and lines, even without a spread
+        if game.get('homePoints') is None or game.get('awayPoints') is None or not game.get('lines'):
+            return
+        
+        home_team = (game.get('homeTeam') or '').lower()
+        is_home_team = self.team_lower in home_team or home_team in self.team_lower
         
         if is_home_team:
-            home_games.append(game)
+            self.home_games += 1
+            if parsed_game is not None:
+                self.home_record.add(parsed_game)
         else:
-            away_games.append(game)
-    
-    home_record = calculate_team_betting_record(home_games, team_name) if home_games else None
-    away_record = calculate_team_betting_record(away_games, team_name) if away_games else None
-    
-    # Calculate scenario breakdowns
-    scenario_performance = {}
-    scenarios = ['road_underdog', 'home_favorite', 'road_favorite', 'home_underdog']
+            self.away_games += 1
+            if parsed_game is not None:
+                self.away_record.add(parsed_game)
+        
+        if parsed_game is None:
+            return
+        
+        # Same scenario rules as build_scenario_where
+        spread = parsed_game[3]
+        team_spread = spread if is_home_team else -spread
+        if not is_home_team and team_spread > 0:
+            scenario = 'road_underdog'
+        elif is_home_team and team_spread < 0:
+            scenario = 'home_favorite'
+        elif not is_home_team and team_spread < 0:
+            scenario = 'road_favorite'
+        elif is_home_team and team_spread > 0:
+            scenario = 'home_underdog'
+        else:
+            return
+        
+        self.scenario_records[scenario].add(parsed_game)
+        self.scenario_spreads[scenario].append(team_spread)
     
-    for scenario in scenarios:
-        scenario_games = filter_games_by_scenario(recent_games, team_name, scenario)
-        if scenario_games:
-            scenario_record = calculate_team_betting_record(scenario_games, team_name)
-            
-            # Calculate average spread for this scenario
-            spreads = []
-            for game in scenario_games:
-                if game.get('lines') and len(game['lines']) > 0:
-                    home_team = game.get('homeTeam', '')
-                    is_home_team = team_lower in home_team.lower() or home_team.lower() in team_lower
-                    spread = safe_numeric_conversion(game['lines'][0].get('spread'))
-                    if spread is not None:
-                        team_spread = spread if is_home_team else -spread
-                        spreads.append(team_spread)
+    def result(self) -> Dict[str, Any]:
+        """Recent betting trends including scenario breakdowns."""
+        if not self.games_seen:
+            return {"error": "No games provided for trend analysis"}
+        
+        recent_record = self.overall.as_dict()
+        home_record = self.home_record.as_dict() if self.home_games else None
+        away_record = self.away_record.as_dict() if self.away_games else None
+        
+        # Calculate scenario breakdowns
+        scenario_performance = {}
+        for scenario in BETTING_SCENARIOS:
+            record = self.scenario_records[scenario]
+            if not record.total_games:
+                continue
             
+            scenario_record = record.as_dict()
+            spreads = self.scenario_spreads[scenario]
             avg_spread = sum(spreads) / len(spreads) if spreads else 0
             
             scenario_performance[scenario] = {
-                "games": len(scenario_games),
+                "games": record.total_games,
                 "ats_record": scenario_record["ats"],
                 "ats_percentage": scenario_record["ats_percentage"],
                 "su_record": scenario_record["su"],
                 "su_percentage": scenario_record["su_percentage"],
                 "avg_spread": round(avg_spread, 1)
             }
-    
-    return {
-        "analysis_period": f"Last {len(recent_games)} games",
-        "overall_trends": {
-            "ats_record": recent_record["ats"],
-            "ats_percentage": recent_record["ats_percentage"],
-            "su_record": recent_record["su"],
-            "su_percentage": recent_record["su_percentage"]
-        },
-        "home_vs_away": {
-            "home_games": len(home_games),
-            "home_ats_record": home_record["ats"] if home_record else "N/A",
-            "home_ats_percentage": home_record["ats_percentage"] if home_record else 0,
-            "away_games": len(away_games),
-            "away_ats_record": away_record["ats"] if away_record else "N/A", 
-            "away_ats_percentage": away_record["ats_percentage"] if away_record else 0
-        },
-        "scenario_performance": scenario_performance
-    }
+        
+        return {
+            "analysis_period": f"Last {self.recent_games} games",
+            "overall_trends": {
+                "ats_record": recent_record["ats"],
+                "ats_percentage": recent_record["ats_percentage"],
+                "su_record": recent_record["su"],
+                "su_percentage": recent_record["su_percentage"]
+            },
+            "home_vs_away": {
+                "home_games": self.home_games,
+                "home_ats_record": home_record["ats"] if home_record else "N/A",
+                "home_ats_percentage": home_record["ats_percentage"] if home_record else 0,
+                "away_games": self.away_games,
+                "away_ats_record": away_record["ats"] if away_record else "N/A", 
+                "away_ats_percentage": away_record["ats_percentage"] if away_record else 0
+            },
+            "scenario_performance": scenario_performance
+        }
 
 
-def analyze_over_under_ranges(games: List[Dict[str, Any]], team_name: str) -> Dict[str, Any]:
+def analyze_betting_trends(games: List[Dict[str, Any]], team_name: str, last_n_games: int = 10) -> Dict[str, Any]:
     """
-    Analyze team O/U performance at different total ranges.
+    Analyze recent betting trends for a team.
     
     Args:
-        games: List of game dictionaries from GraphQL query
+        games: List of game dictionaries from GraphQL query (should be ordered by date DESC)
         team_name: Name of team to analyze
+        last_n_games: Number of recent games to analyze
         
     Returns:
-        Dictionary with O/U performance breakdown by total range
+        Dictionary with recent betting trends including scenario breakdowns
     """
-    # Define total ranges with clear labels
-    ranges = [
-        ("low_totals", 0, 45, "Under 45 points"),
-        ("medium_low", 45, 55, "45-55 points"),
-        ("medium", 55, 65, "55-65 points"),
-        ("medium_high", 65, 75, "65-75 points"),
-        ("high_totals", 75, 999, "Over 75 points")
-    ]
+    analyzer = BettingTrendsAnalyzer(team_name, last_n_games)
+    for game in games:
+        analyzer.update(game)
+    return analyzer.result()
+
+
+# Betting total ranges, [min, max)
+TOTAL_RANGES = [
+    ("low_totals", 0, 45, "Under 45 points"),
+    ("medium_low", 45, 55, "45-55 points"),
+    ("medium", 55, 65, "55-65 points"),
+    ("medium_high", 65, 75, "65-75 points"),
+    ("high_totals", 75, 999, "Over 75 points")
+]
+
+
+class OverUnderRangeAnalyzer:
+    """Single-pass accumulator of a team's O/U record by betting total range."""
     
-    range_performance = {}
+    def __init__(self):
+        # range_key -> [games, overs]
+        self.counts = {range_key: [0, 0] for range_key, _, _, _ in TOTAL_RANGES}
     
-    for range_key, min_total, max_total, display_name in ranges:
-        range_games = []
-        overs = 0
-        unders = 0
+    def update(self, game: Dict[str, Any]) -> None:
+        """Add a game to the total range its O/U line falls in."""
+        # Skip games without complete data
+        lines = game.get('lines')
+        if game.get('homePoints') is None or game.get('awayPoints') is None or not lines:
+            return
         
-        for game in games:
-            # Skip games without complete data
-            if not all([
-                game.get('homePoints') is not None,
-                game.get('awayPoints') is not None,
-                game.get('lines') and len(game['lines']) > 0,
-                game['lines'][0].get('overUnder') is not None
-            ]):
-                continue
-                
-            line = game['lines'][0]
-            over_under = safe_numeric_conversion(line.get('overUnder'))
-            if not over_under:
-                continue
-                
-            # Check if O/U line falls in this range
-            if min_total <= over_under < max_total:
-                home_points = safe_numeric_conversion(game.get('homePoints'))
-                away_points = safe_numeric_conversion(game.get('awayPoints'))
-                
-                if home_points is not None and away_points is not None:
-                    actual_total = home_points + away_points
-                    range_games.append(game)
-                    
-                    if actual_total > over_under:
-                        overs += 1
-                    else:
-                        unders += 1
+        over_under = safe_numeric_conversion(lines[0].get('overUnder'))
+        if not over_under:
+            return
         
-        if range_games:
-            over_pct = round(overs/len(range_games)*100, 1) if range_games else 0
-            range_performance[range_key] = {
-                "display_name": display_name,
-                "games": len(range_games),
-                "over_record": f"{overs}-{unders}",
-                "over_percentage": over_pct,
-                "under_percentage": round(100 - over_pct, 1)
-            }
+        home_points = safe_numeric_conversion(game.get('homePoints'))
+        away_points = safe_numeric_conversion(game.get('awayPoints'))
+        if home_points is None or away_points is None:
+            return
+        
+        for range_key, min_total, max_total, _ in TOTAL_RANGES:
+            if min_total <= over_under < max_total:
+                counts = self.counts[range_key]
+                counts[0] += 1
+                if home_points + away_points > over_under:
+                    counts[1] += 1
+                break
     
-    return range_performance
+    def result(self) -> Dict[str, Any]:
+        """O/U performance for ranges that had at least one game."""
+        range_performance = {}
+        
+        for range_key, _, _, display_name in TOTAL_RANGES:
+            games, overs = self.counts[range_key]
+            if games:
+                over_pct = round(overs / games * 100, 1)
+                range_performance[range_key] = {
+                    "display_name": display_name,
+                    "games": games,
+                    "over_record": f"{overs}-{games - overs}",
+                    "over_percentage": over_pct,
+                    "under_percentage": round(100 - over_pct, 1)
+                }
+        
+        return range_performance
 
 
 def format_betting_analysis_response(
@@ -756,80 +794,117 @@ def format_betting_analysis_response(
         }
 
 
-def calculate_betting_analysis_from_graphql(graphql_result: str, team_id: int = None) -> Dict[str, Any]:
+def find_team_name(games: List[Dict[str, Any]], team_id: int) -> Optional[str]:
     """
-    Calculate betting analysis from a GraphQL response string.
+    Find a team's school name from the team info embedded in its games.
     
     Args:
-        graphql_result: JSON string from GraphQL betting lines query
+        games: List of game dictionaries from GraphQL query
+        team_id: Team ID to look up
+        
+    Returns:
+        School name from the first game involving the team, or None
+    """
+    for game in games:
+        home_team_info = game.get('homeTeamInfo') or {}
+        away_team_info = game.get('awayTeamInfo') or {}
+        
+        if home_team_info.get('teamId') == team_id:
+            return home_team_info.get('school')
+        elif away_team_info.get('teamId') == team_id:
+            return away_team_info.get('school')
+    
+    return None
+
+
+def build_betting_analysis_bundle(games: List[Dict[str, Any]], team_name: str) -> Dict[str, Any]:
+    """
+    Precompute the opponent-independent betting analyses for a team's games.
+    
+    The bundle is cached by GetBettingAnalysis so repeated calls for the
+    same team and season are lookups rather than reprocessing.
+    
+    Args:
+        games: List of game dictionaries from GraphQL query
+        team_name: Name of team to analyze
+        
+    Returns:
+        Dictionary with team_name, spread_ranges and over_under
+    """
+    team_lower = team_name.lower()
+    spread_ranges = SpreadRangeAnalyzer(team_name)
+    over_under = OverUnderRangeAnalyzer()
+    
+    # One pass over the games feeds every analysis
+    for game in games:
+        parsed_game = _parse_betting_game(game, team_lower)
+        if parsed_game is not None:
+            spread_ranges.add(parsed_game)
+        over_under.update(game)
+    
+    return {
+        "team_name": team_name,
+        "spread_ranges": spread_ranges.result(),
+        "over_under": over_under.result()
+    }
+
+
+def calculate_betting_analysis_from_graphql(
+    graphql_result: Union[str, Dict[str, Any]],
+    team_id: int = None
+) -> Dict[str, Any]:
+    """
+    Calculate betting analysis from a GraphQL response.
+    
+    Args:
+        graphql_result: GraphQL betting lines response (JSON string or parsed dict)
         team_id: Team ID to analyze (for team name lookup)
         
     Returns:
         Dictionary with betting analysis or None if insufficient data
     """
     try:
-        data = json.loads(graphql_result)
+        data = graphql_result if isinstance(graphql_result, dict) else json_utils.loads(graphql_result)
         games = data.get('data', {}).get('game', [])
         
         if not games or not team_id:
             return None
             
         # Get team name from first game
-        team_name = None
-        for game in games:
-            home_team_info = game.get('homeTeamInfo', {})
-            away_team_info = game.get('awayTeamInfo', {})
-            
-            if home_team_info.get('teamId') == team_id:
-                team_name = home_team_info.get('school')
-                break
-            elif away_team_info.get('teamId') == team_id:
-                team_name = away_team_info.get('school')
-                break
+        team_name = find_team_name(games, team_id)
         
         if not team_name:
             return None
-            
-        # Calculate betting record using existing function
-        betting_record = calculate_team_betting_record(games, team_name)
         
-        # Add per-game details
+        # Each game is parsed once and feeds both the record and its details
+        team_lower = team_name.lower()
+        betting_record = BettingRecord()
         game_details = []
         for game in games:
-            if not all([
-                game.get('homePoints') is not None,
-                game.get('awayPoints') is not None,
-                game.get('lines') and len(game['lines']) > 0,
-                game['lines'][0].get('spread') is not None
-            ]):
+            parsed_game = _parse_betting_game(game, team_lower)
+            if parsed_game is None:
                 continue
-                
-            home_points = safe_numeric_conversion(game['homePoints'])
-            away_points = safe_numeric_conversion(game['awayPoints'])
-            home_team = game.get('homeTeam', '')
-            away_team = game.get('awayTeam', '')
-            line = game['lines'][0]  # Use first betting line
-            spread = safe_numeric_conversion(line['spread'])
-            over_under = line.get('overUnder')
+            betting_record.add(parsed_game)
             
-            # Determine opponent and game result
-            team_lower = team_name.lower()
-            is_home_team = team_lower in home_team.lower() or home_team.lower() in team_lower
+            is_home_team, home_points, away_points, spread, over_under_line = parsed_game
+            over_under = game['lines'][0].get('overUnder')
             
+            # Determine opponent and game result
             if is_home_team:
-                opponent = away_team
+                opponent = game.get('awayTeam', '')
                 team_score = home_points
                 opponent_score = away_points
                 spread_text = f"{spread:+.1f}" if spread != 0 else "PK"
             else:
-                opponent = home_team
+                opponent = game.get('homeTeam', '')
                 team_score = away_points
                 opponent_score = home_points
                 spread_text = f"{-spread:+.1f}" if spread != 0 else "PK"
             
             # Calculate outcomes
-            ats_covered = calculate_ats_outcome(home_points, away_points, spread, team_name, home_team, away_team)
-            ou_over = calculate_ou_outcome(home_points, away_points, over_under) if over_under else None
+            total = home_points + away_points
+            ats_covered = _ats_covered(is_home_team, home_points - away_points, spread)
+            ou_over = over_under_line is not None and total > over_under_line if over_under else None
             su_won = team_score > opponent_score
             
             # Format result
@@ -840,13 +915,13 @@ def calculate_betting_analysis_from_graphql(graphql_result: str, team_id: int =
                 "spread": spread_text,
                 "ats_result": "Covered" if ats_covered else "Did not cover",
                 "over_under": over_under,
-                "ou_result": f"Over ({home_points + away_points} > {over_under})" if ou_over else f"Under ({home_points + away_points} < {over_under})" if over_under else "No line",
+                "ou_result": f"Over ({total} > {over_under})" if ou_over else f"Under ({total} < {over_under})" if over_under else "No line",
                 "week": game.get('week'),
                 "season": game.get('season')
             })
         
         return {
-            "summary": betting_record,
+            "summary": betting_record.as_dict(),
             "game_details": game_details
         }
         
@@ -5,10 +5,68 @@ Functions to calculate scoring trends, upset analysis, momentum shifts,
 and weekly game statistics from GraphQL query results.
 """
 
-import json
-from typing import List, Dict, Any, Optional, Tuple
+import os
+from datetime import date
+from typing import List, Dict, Any, Optional, Tuple, Union
 from statistics import mean, median
 
+from utils import json_utils
+
+
+def current_season_year(today: Optional[date] = None) -> int:
+    """
+    Get the season year in progress (seasons start in August and run into January).
+    
+    Args:
+        today: Date to evaluate (default: today)
+        
+    Returns:
+        Season year
+    """
+    today = today or date.today()
+    return today.year if today.month >= 8 else today.year - 1
+
+
+# Season most requests target; overridable for deployments pinned to a year
+CURRENT_SEASON = int(os.getenv("CURRENT_SEASON") or current_season_year())
+
+
+def is_historical_season(season: Optional[int]) -> bool:
+    """
+    Check whether a season is finished, so its games and lines no longer change.
+    
+    Args:
+        season: Season year
+        
+    Returns:
+        True if the season is before the current season
+    """
+    return season is not None and season < current_season_year()
+
+
+# A completed game's (home points, away points, first betting line or None, game)
+_CompletedGame = Tuple[int, int, Optional[Dict[str, Any]], Dict[str, Any]]
+
+
+def _completed_games(games: List[Dict[str, Any]]) -> List[_CompletedGame]:
+    """
+    Extract the scored, completed games once for the analyses below.
+    
+    Each analysis used to re-walk every game dict and repeat the same field
+    lookups; the combined analyses now share one pass.
+    """
+    completed = []
+    for game in games:
+        if game.get('status') != 'completed':
+            continue
+        home_pts = game.get('homePoints')
+        away_pts = game.get('awayPoints')
+        if home_pts is None or away_pts is None:
+            continue
+        lines = game.get('lines')
+        completed.append((home_pts, away_pts, lines[0] if lines else None, game))
+    return completed
+
 
 def calculate_scoring_trends(games: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
@@ -22,32 +80,20 @@ def calculate_scoring_trends(games: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     if not games:
         return {"error": "No games provided"}
-    
-    total_scores = []
-    home_scores = []
-    away_scores = []
-    margins = []
-    completed_games = 0
-    
-    for game in games:
-        if (game.get('status') == 'completed' and 
-            game.get('homePoints') is not None and 
-            game.get('awayPoints') is not None):
-            
-            home_pts = game['homePoints']
-            away_pts = game['awayPoints']
-            total = home_pts + away_pts
-            margin = abs(home_pts - away_pts)
-            
-            total_scores.append(total)
-            home_scores.append(home_pts)
-            away_scores.append(away_pts)
-            margins.append(margin)
-            completed_games += 1
-    
-    if completed_games == 0:
+    return _scoring_trends(_completed_games(games))
+
+
+def _scoring_trends(completed: List[_CompletedGame]) -> Dict[str, Any]:
+    """Scoring trend analysis over pre-extracted completed games."""
+    if not completed:
         return {"error": "No completed games found"}
     
+    home_scores = [home_pts for home_pts, _, _, _ in completed]
+    away_scores = [away_pts for _, away_pts, _, _ in completed]
+    total_scores = [home_pts + away_pts for home_pts, away_pts, _, _ in completed]
+    margins = [abs(home_pts - away_pts) for home_pts, away_pts, _, _ in completed]
+    completed_games = len(completed)
+    
     return {
         "games_analyzed": completed_games,
         "total_points": {
@@ -85,20 +131,18 @@ def calculate_upset_analysis(games: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     if not games:
         return {"error": "No games provided"}
-    
+    return _upset_analysis(_completed_games(games))
+
+
+def _upset_analysis(completed: List[_CompletedGame]) -> Dict[str, Any]:
+    """Upset analysis over pre-extracted completed games."""
     upsets = []
     favorites_analysis = []
     games_with_lines = 0
     
-    for game in games:
-        if (game.get('status') == 'completed' and 
-            game.get('homePoints') is not None and 
-            game.get('awayPoints') is not None and
-            game.get('lines') and len(game['lines']) > 0):
-            
-            home_pts = game['homePoints']
-            away_pts = game['awayPoints']
-            line = game['lines'][0]  # Use first betting line
+    for home_pts, away_pts, line, game in completed:
+        # Use first betting line
+        if line is not None:
             spread = line.get('spread')
             
             if spread is None:
@@ -172,25 +216,21 @@ def calculate_weekly_trends(games: List[Dict[str, Any]]) -> Dict[str, Any]:
     if not games:
         return {"error": "No games provided"}
     
-    # Reuse existing functions and add weekly-specific metrics
-    scoring_trends = calculate_scoring_trends(games)
-    upset_analysis = calculate_upset_analysis(games)
+    # Reuse existing analyses and add weekly-specific metrics
+    completed = _completed_games(games)
+    scoring_trends = _scoring_trends(completed)
+    upset_analysis = _upset_analysis(completed)
     
     # Additional weekly-specific analysis
     over_under_analysis = []
     games_with_totals = 0
     
-    for game in games:
-        if (game.get('status') == 'completed' and 
-            game.get('homePoints') is not None and 
-            game.get('awayPoints') is not None and
-            game.get('lines') and len(game['lines']) > 0):
-            
-            line = game['lines'][0]
+    for home_pts, away_pts, line, _ in completed:
+        if line is not None:
             over_under = line.get('overUnder')
             
             if over_under is not None:
-                total_points = game['homePoints'] + game['awayPoints']
+                total_points = home_pts + away_pts
                 went_over = total_points > over_under
                 over_under_analysis.append({
                     "total_points": total_points,
@@ -219,19 +259,19 @@ def calculate_weekly_trends(games: List[Dict[str, Any]]) -> Dict[str, Any]:
     return weekly_summary
 
 
-def calculate_game_stats_from_graphql(graphql_result: str, analysis_type: str = "trends") -> Dict[str, Any]:
+def calculate_game_stats_from_graphql(graphql_result: Union[str, Dict[str, Any]], analysis_type: str = "trends") -> Dict[str, Any]:
     """
-    Calculate game statistics from a GraphQL response string.
+    Calculate game statistics from a GraphQL response.
     
     Args:
-        graphql_result: JSON string from GraphQL games query
+        graphql_result: GraphQL games query response (JSON string or parsed dict)
         analysis_type: Type of analysis - "trends", "upsets", "weekly"
         
     Returns:
         Dictionary with game analysis or None if insufficient data
     """
     try:
-        data = json.loads(graphql_result)
+        data = graphql_result if isinstance(graphql_result, dict) else json_utils.loads(graphql_result)
         games = data.get('data', {}).get('game', [])
         
         if not games:
@@ -245,9 +285,10 @@ def calculate_game_stats_from_graphql(graphql_result: str, analysis_type: str =
             return calculate_weekly_trends(games)
         else:
             # Default: return comprehensive analysis
+            completed = _completed_games(games)
             return {
-                "scoring_trends": calculate_scoring_trends(games),
-                "upset_analysis": calculate_upset_analysis(games)
+                "scoring_trends": _scoring_trends(completed),
+                "upset_analysis": _upset_analysis(completed)
             }
             
     except Exception as e:
@@ -5,7 +5,24 @@ Provides shared fragments, query builders, and common GraphQL patterns
 to reduce duplication across tools and ensure consistency.
 """
 
-from typing import Dict, Any, Optional, List, Union
+import re
+from copy import copy
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple, Union
+
+from graphql import parse, parse_value, print_ast, visit
+from graphql.language import FieldNode, OperationDefinitionNode, SelectionSetNode, Visitor
+
+from utils import json_utils
+
+# Variable value types that can be used in a hashable cache key as-is
+_SCALAR_TYPES = (str, int, float, bool)
+
+# String literals (kept verbatim) or runs of ignored characters (whitespace,
+# commas, comments) in a GraphQL document
+_QUERY_IGNORED = re.compile(r'"(?:[^"\\\n]|\\.)*"|(?:[\s,]|#[^\n]*)+')
+
+# Punctuators, around which no separating space is needed
+_QUERY_PUNCTUATORS = frozenset('{}()[]:=!$@|&')
 
 
 # =============================================================================
@@ -123,6 +140,144 @@ def build_query_variables(**kwargs) -> Dict[str, Any]:
     return {k: v for k, v in kwargs.items() if v is not None}
 
 
+def freeze_query_variables(variables: Dict[str, Any]) -> Union[Tuple[Tuple[str, Any], ...], str]:
+    """
+    Build a hashable, order-independent key for a variables dictionary.
+    
+    Flat variables (the common case) become a sorted tuple of items, which
+    avoids serializing them; nested values such as `where` expressions fall
+    back to canonical JSON.
+    
+    Args:
+        variables: GraphQL variables dictionary
+        
+    Returns:
+        Sorted tuple of (name, value) pairs, or a sorted-keys JSON string
+    """
+    if all(isinstance(value, _SCALAR_TYPES) for value in variables.values()):
+        return tuple(sorted(variables.items()))
+    return json_utils.dumps(variables, sort_keys=True)
+
+
+def minify_query(query: str) -> str:
+    """
+    Strip comments and insignificant whitespace from a GraphQL document.
+    
+    Tokens are separated by a single space only where both neighbours are
+    names or values; string literals are left untouched.
+    
+    Args:
+        query: GraphQL query string
+        
+    Returns:
+        Equivalent query string without formatting
+    """
+    def separator(match: "re.Match[str]") -> str:
+        text = match.group()
+        if text.startswith('"'):
+            return text
+        start, end = match.span()
+        if start == 0 or end == len(query):
+            return ''
+        if query[start - 1] in _QUERY_PUNCTUATORS or query[end] in _QUERY_PUNCTUATORS:
+            return ''
+        return ' '
+    
+    return _QUERY_IGNORED.sub(separator, query)
+
+
+def project_selection_set(query: str, required_fields: FrozenSet[str]) -> str:
+    """
+    Trim a query's root selection sets to the fields a consumer reads.
+    
+    Nested fields are named by dotted path (e.g. "lines.spread"); a nested
+    selection is kept if any required field lies under it. Fields are
+    matched by response key, so arguments and directives don't affect
+    matching; fragment spreads are kept as-is.
+    
+    Args:
+        query: GraphQL query string
+        required_fields: Dotted paths of the fields to keep
+        
+    Returns:
+        Query string selecting only the required fields
+        
+    Raises:
+        ValueError: If the document has no operation with a selection to project
+    """
+    def project(selection_set: SelectionSetNode, prefix: str) -> SelectionSetNode:
+        selections = []
+        for selection in selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                selections.append(selection)
+                continue
+            path = prefix + (selection.alias or selection.name).value
+            if selection.selection_set is None:
+                if path in required_fields:
+                    selections.append(selection)
+            elif any(field.startswith(path + ".") for field in required_fields):
+                field = copy(selection)
+                field.selection_set = project(selection.selection_set, path + ".")
+                selections.append(field)
+        return SelectionSetNode(selections=tuple(selections))
+    
+    document = parse(query, no_location=True)
+    projected = False
+    for definition in document.definitions:
+        if not isinstance(definition, OperationDefinitionNode):
+            continue
+        # The root fields (e.g. `game`) stay; their selections are projected
+        for root_field in definition.selection_set.selections:
+            if isinstance(root_field, FieldNode) and root_field.selection_set is not None:
+                root_field.selection_set = project(root_field.selection_set, "")
+                projected = True
+    
+    if not projected:
+        raise ValueError("Query has no root field selection to project")
+    return print_ast(document) + "\n"
+
+def inline_variable(query: str, name: str, literal: str) -> str:
+    """
+    Replace a query variable with a literal value and drop its declaration.
+    
+    Lets a frequently used filter be sent as literals the server can plan
+    for, while the variable form keeps serving every other filter.
+    
+    Args:
+        query: GraphQL query string
+        name: Variable name, without the `$`
+        literal: GraphQL value literal to use in its place
+        
+    Returns:
+        Query string with the variable inlined
+        
+    Raises:
+        ValueError: If no operation in the query declares the variable
+    """
+    value = parse_value(literal, no_location=True)
+    document = parse(query, no_location=True)
+    
+    declared = False
+    for definition in document.definitions:
+        if isinstance(definition, OperationDefinitionNode):
+            variable_definitions = tuple(
+                variable_definition for variable_definition in definition.variable_definitions
+                if variable_definition.variable.name.value != name
+            )
+            if len(variable_definitions) != len(definition.variable_definitions):
+                definition.variable_definitions = variable_definitions
+                declared = True
+    if not declared:
+        raise ValueError(f"Query does not declare ${name}")
+    
+    class VariableInliner(Visitor):
+        def enter_variable(self, node, *_):
+            if node.name.value == name:
+                return value
+    
+    return print_ast(visit(document, VariableInliner())) + "\n"
+
+
 def build_team_info_fields(extended: bool = False) -> str:
     """
     Build team info fields for GraphQL queries.
@@ -0,0 +1,50 @@
+"""
+JSON serialization utilities for NCAAF MCP tools.
+
+Thin wrappers around orjson so the per-request parse/serialize work on
+GraphQL responses goes through one fast, consistent codec.
+"""
+
+from typing import Any, Union
+
+import orjson
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError and ValueError
+JSONDecodeError = orjson.JSONDecodeError
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON text as str or bytes
+        
+    Returns:
+        Parsed Python object
+        
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    return orjson.loads(data)
+
+
+def dumps(data: Any, pretty: bool = False, sort_keys: bool = False) -> str:
+    """
+    Serialize a Python object to a JSON string.
+    
+    Args:
+        data: Object to serialize
+        pretty: Indent output with two spaces
+        sort_keys: Sort dictionary keys (for canonical/cache-key output)
+        
+    Returns:
+        JSON string
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(data, option=option).decode()
+
@@ -7,6 +7,8 @@ to reduce duplication and ensure consistent behavior across all tools.
 
 from typing import Any, Optional, Union, Dict
 
+from src.models import MAX_QUERY_LIMIT
+
 
 def safe_int_conversion(value: Union[str, int, None], param_name: str = None) -> Optional[int]:
     """
@@ -22,13 +24,14 @@ def safe_int_conversion(value: Union[str, int, None], param_name: str = None) ->
     Raises:
         ValueError: If conversion fails and value is not None
     """
-    if value is None:
-        return None
-    
-    if isinstance(value, int):
+    # Fast path: programmatic callers usually pass native ints already
+    if value is None or isinstance(value, int):
         return value
     
     if isinstance(value, str):
+        # Plain ASCII digits ("2024", "15") need no cleaning
+        if value.isascii() and value.isdigit():
+            return int(value)
         try:
             # Strip whitespace and quotes, then convert
             cleaned = value.strip().strip('"').strip("'")
@@ -61,10 +64,8 @@ def safe_bool_conversion(value: Union[str, bool, None], param_name: str = None)
     Returns:
         Converted boolean or None if input was None
     """
-    if value is None:
-        return None
-    
-    if isinstance(value, bool):
+    # Fast path: programmatic callers usually pass native bools already
+    if value is None or isinstance(value, bool):
         return value
     
     if isinstance(value, str):
@@ -137,6 +138,32 @@ def validate_limit(limit: Union[str, int, None], default: int = 100, max_limit:
     return limit_int
 
 
+def clamp_limit(limit: Union[str, int, None], default: int = 100, max_limit: int = MAX_QUERY_LIMIT) -> int:
+    """
+    Convert a limit parameter, capping it instead of rejecting large values.
+    
+    Args:
+        limit: Limit value to convert
+        default: Default limit if None provided
+        max_limit: Largest limit passed on to the query
+        
+    Returns:
+        Limit between 1 and max_limit
+        
+    Raises:
+        ValueError: If limit is not a positive integer
+    """
+    if limit is None:
+        return min(default, max_limit)
+    
+    limit_int = safe_int_conversion(limit, 'limit')
+    
+    if limit_int <= 0:
+        raise ValueError(f"Limit must be positive, got {limit_int}")
+    
+    return min(limit_int, max_limit)
+
+
 def preprocess_team_params(
     team_id: Union[str, int, None] = None,
     conference: Union[str, None] = None,
@@ -262,8 +289,8 @@ def preprocess_game_params(
     else:
         params['season_type'] = None
     
-    # Limit with validation
-    params['limit'] = validate_limit(limit, default=100, max_limit=1000)
+    # Limit, capped to bound response size
+    params['limit'] = clamp_limit(limit, default=100)
     
     # Data inclusion flags
     params['include_betting_lines'] = safe_bool_conversion(include_betting_lines, 'include_betting_lines')
@@ -0,0 +1,223 @@
+"""
+In-process response cache for GraphQL queries.
+
+Tools issue the same deterministic queries repeatedly (an agent asking for
+the same week's games or a team's lines several times in a conversation).
+cached_execute_graphql serves repeats from memory and coalesces concurrent
+identical requests into a single upstream call; cached_response and
+cached_value do the same for a tool's formatted output and other values
+derived from a query's results.
+"""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple, Union
+
+from fastmcp import Context
+
+from src.graphql_executor import execute_graphql
+from utils.graphql_utils import freeze_query_variables
+from utils.game_utils import is_historical_season
+
+# Cache TTL for data that can still change (in-progress seasons)
+DEFAULT_TTL = float(os.getenv("CACHE_TTL", "300"))
+
+# Finished seasons no longer change
+HISTORICAL_TTL = 86400
+
+_CACHE_MAXSIZE = int(os.getenv("QUERY_CACHE_MAXSIZE", "2048"))
+
+# (query, frozen variables, entry tag) -> (expires_at, result). The tag is
+# ('query', return_raw_dict) for responses, ('response', variant) for tool
+# output, and a caller-chosen tuple for derived values, so the kinds of
+# entry never share a key.
+_cache: "OrderedDict[Tuple[str, Any, Any], Tuple[float, Any]]" = OrderedDict()
+
+# Requests currently being fetched, shared by concurrent identical calls
+_in_flight: Dict[Tuple[str, Any, Any], asyncio.Future] = {}
+
+# Sentinel for a cache miss (None is a valid cached result)
+_MISSING = object()
+
+# Lookup counters reported by query_cache_info
+_stats = {"hits": 0, "misses": 0}
+
+
+def _store(key: Tuple[str, Any, Any], ttl: float, task: asyncio.Future) -> None:
+    """Record a finished fetch, caching successful results."""
+    _in_flight.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    
+    _cache[key] = (time.monotonic() + ttl, task.result())
+    _cache.move_to_end(key)
+    if len(_cache) > _CACHE_MAXSIZE:
+        _cache.popitem(last=False)
+
+
+async def cached_execute_graphql(
+    query: str,
+    variables: Dict[str, Any] = None,
+    ctx: Context = None,
+    ttl: Optional[float] = None,
+    season: Optional[int] = None,
+    return_raw_dict: bool = False
+) -> Union[str, Dict[str, Any]]:
+    """
+    Execute a GraphQL query, serving repeats from an in-process TTL cache.
+    
+    Args:
+        query: GraphQL query string
+        variables: Query variables dictionary
+        ctx: MCP context for logging
+        ttl: Cache lifetime in seconds (default: one day for historical
+            seasons, CACHE_TTL otherwise)
+        season: Season the query is for, when it is not a top-level
+            `season` variable (e.g. inside a `where` expression)
+        return_raw_dict: Return the parsed response dict instead of a JSON
+            string. The dict is shared with the cache and must not be mutated.
+    
+    Returns:
+        JSON string containing the query results, or the response dict if
+        return_raw_dict is set
+    
+    Raises:
+        GraphQLError: If query execution fails (failures are not cached)
+    """
+    variables = variables or {}
+    key = (query, freeze_query_variables(variables), ('query', return_raw_dict))
+    
+    result = _lookup(key)
+    if result is not _MISSING:
+        return result
+    
+    historical = is_historical_season(season if season is not None else variables.get('season'))
+    return await _fetch_shared(
+        key,
+        ttl if ttl is not None else (HISTORICAL_TTL if historical else DEFAULT_TTL),
+        lambda: execute_graphql(
+            query,
+            variables,
+            ctx,
+            cache_ttl=HISTORICAL_TTL if historical else None,
+            return_raw_dict=return_raw_dict
+        )
+    )
+
+
+async def cached_response(
+    query: str,
+    variables: Dict[str, Any],
+    variant: Hashable,
+    build: Callable[[], Awaitable[str]],
+    season: Optional[int] = None
+) -> str:
+    """
+    Serve a tool's final output for a query from the cache.
+    
+    Repeated identical tool calls skip the analyses and formatting as well
+    as the fetch. Entries share cached_execute_graphql's lifetimes and are
+    dropped with the query's responses by clear_query_cache.
+    
+    Args:
+        query: GraphQL query string the output is built from
+        variables: Query variables dictionary
+        variant: Output options that change the text for the same query
+            (e.g. raw data, analyses)
+        build: Coroutine function producing the output on a miss
+        season: Season the query is for, when it is not a top-level
+            `season` variable
+    
+    Returns:
+        The tool's output text
+    """
+    return await cached_value(query, variables, ('response', variant), build, season=season)
+
+
+async def cached_value(
+    query: str,
+    variables: Dict[str, Any],
+    tag: Tuple[Hashable, ...],
+    build: Callable[[], Awaitable[Any]],
+    season: Optional[int] = None
+) -> Any:
+    """
+    Serve a value derived from a query's results from the cache.
+    
+    Concurrent callers share one build, and entries follow
+    cached_execute_graphql's lifetimes and are dropped with the query's
+    responses by clear_query_cache.
+    
+    Args:
+        query: GraphQL query string the value is built from
+        variables: Query variables dictionary
+        tag: Tuple naming the kind of value first, e.g. ('analysis',
+            team_id, season, scenario); 'query' and 'response' are taken by
+            cached_execute_graphql and cached_response
+        build: Coroutine function producing the value on a miss
+        season: Season the query is for, when it is not a top-level
+            `season` variable
+    
+    Returns:
+        The cached or newly built value, which must not be mutated
+    """
+    key = (query, freeze_query_variables(variables), tag)
+    
+    result = _lookup(key)
+    if result is not _MISSING:
+        return result
+    
+    historical = is_historical_season(season if season is not None else variables.get('season'))
+    return await _fetch_shared(key, HISTORICAL_TTL if historical else DEFAULT_TTL, build)
+
+
+def _lookup(key: Tuple[str, Any, Any]) -> Any:
+    """Return an unexpired cached result, or _MISSING, updating the hit/miss counters."""
+    entry = _cache.get(key)
+    if entry is not None:
+        expires_at, result = entry
+        if time.monotonic() < expires_at:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return result
+        del _cache[key]
+    
+    _stats["misses"] += 1
+    return _MISSING
+
+
+async def _fetch_shared(key: Tuple[str, Any, Any], ttl: float,
+                        fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Run fetch once for concurrent callers with the same key, caching the result for ttl."""
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _in_flight[key] = task
+        task.add_done_callback(partial(_store, key, ttl))
+    
+    # Shield so one caller's cancellation doesn't cancel the shared fetch
+    return await asyncio.shield(task)
+
+
+def clear_query_cache(queries: Optional[Iterable[str]] = None) -> None:
+    """
+    Drop cached responses.
+    
+    Args:
+        queries: Only drop responses for these query documents (default: all)
+    """
+    if queries is None:
+        _cache.clear()
+        return
+    
+    queries = set(queries)
+    for key in [key for key in _cache if key[0] in queries]:
+        del _cache[key]
+
+
+def query_cache_info() -> Dict[str, int]:
+    """Report cache hits, misses, and current/maximum size (like lru_cache's cache_info)."""
+    return {**_stats, "currsize": len(_cache), "maxsize": _CACHE_MAXSIZE}
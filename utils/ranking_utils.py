@@ -5,11 +5,12 @@ Functions to calculate ranking movement, volatility, biggest movers,
 and historical ranking trends from GraphQL query results.
 """
 
-import json
 from typing import List, Dict, Any, Optional, Tuple
 from statistics import mean, stdev
 from collections import defaultdict
 
+from utils import json_utils
+
 
 def calculate_ranking_movement(current_rankings: List[Dict[str, Any]], 
                              previous_rankings: List[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -362,7 +363,7 @@ def calculate_ranking_movement_from_graphql(graphql_result: str,
         Dictionary with ranking movement analysis
     """
     try:
-        current_data = json.loads(graphql_result)
+        current_data = json_utils.loads(graphql_result)
         current_rankings = current_data.get('data', {}).get('rankings', [])
         
         if not current_rankings:
@@ -371,7 +372,7 @@ def calculate_ranking_movement_from_graphql(graphql_result: str,
         previous_rankings = None
         if previous_graphql_result:
             try:
-                previous_data = json.loads(previous_graphql_result)
+                previous_data = json_utils.loads(previous_graphql_result)
                 previous_rankings = previous_data.get('data', {}).get('rankings', [])
             except:
                 pass  # Ignore errors in previous rankings
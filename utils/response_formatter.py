@@ -5,11 +5,27 @@ Provides functions to format raw GraphQL responses into human-readable
 summaries while optionally preserving the original data.
 """
 
-import json
 import yaml
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
+from utils import json_utils
+
+
+# Fields each formatter reads, as dotted paths under the root query field.
+# Tools use these to request only what the formatted output needs.
+REQUIRED_FIELDS = {
+    'betting': frozenset({
+        'id', 'season', 'week', 'startDate', 'status',
+        'homePoints', 'awayPoints',
+        'excitement', 'conferenceGame', 'neutralSite',
+        'homeStartElo', 'awayStartElo',
+        'homePostgameWinProb', 'awayPostgameWinProb',
+        'homeTeamInfo.school', 'awayTeamInfo.school',
+        'lines.spread', 'lines.overUnder', 'lines.moneylineHome', 'lines.moneylineAway'
+    }),
+}
+
 
 def optimize_for_yaml(data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -41,8 +57,15 @@ def optimize_for_yaml(data: Dict[str, Any]) -> Dict[str, Any]:
     return clean_dict(data)
 
 
+def parse_raw_data(raw_data: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Return a GraphQL response as a dict, parsing only if it is still JSON text."""
+    if isinstance(raw_data, dict):
+        return raw_data
+    return json_utils.loads(raw_data)
+
+
 def create_formatted_response(
-    raw_data: str,
+    raw_data: Union[str, Dict[str, Any]],
     summary: Dict[str, Any],
     formatted_entries: List[Dict[str, Any]],
     include_raw_data: bool = False
@@ -51,7 +74,7 @@ def create_formatted_response(
     Create a standardized formatted response structure in YAML format.
     
     Args:
-        raw_data: Original JSON response from GraphQL
+        raw_data: Original JSON response from GraphQL (string or parsed dict)
         summary: Summary information about the results
         formatted_entries: Human-readable data entries
         include_raw_data: Whether to include the raw GraphQL response
@@ -66,8 +89,8 @@ def create_formatted_response(
     
     if include_raw_data:
         try:
-            response["raw"] = json.loads(raw_data)  # Shortened key
-        except json.JSONDecodeError:
+            response["raw"] = parse_raw_data(raw_data)  # Shortened key
+        except json_utils.JSONDecodeError:
             response["raw"] = {"error": "Could not parse raw data"}
     
     # Optimize for YAML output (remove nulls, clean up data)
@@ -95,7 +118,7 @@ def format_teams_response(raw_data: str, include_raw_data: bool = False) -> str:
         Formatted JSON response
     """
     try:
-        data = json.loads(raw_data)
+        data = parse_raw_data(raw_data)
         teams = data.get("data", {}).get("currentTeams", [])
         
         # Create summary
@@ -125,10 +148,10 @@ def format_teams_response(raw_data: str, include_raw_data: bool = False) -> str:
         return create_formatted_response(raw_data, summary, formatted_entries, include_raw_data)
         
     except Exception as e:
-        return json.dumps({
+        return json_utils.dumps({
             "error": f"Failed to format teams response: {str(e)}",
             "raw_data": raw_data if include_raw_data else None
-        }, indent=2)
+        }, pretty=True)
 
 
 def format_games_response(raw_data: str, include_raw_data: bool = False) -> str:
@@ -143,7 +166,7 @@ def format_games_response(raw_data: str, include_raw_data: bool = False) -> str:
         Formatted JSON response
     """
     try:
-        data = json.loads(raw_data)
+        data = parse_raw_data(raw_data)
         games = data.get("data", {}).get("game", [])
         
         # Create summary
@@ -237,13 +260,13 @@ def format_games_response(raw_data: str, include_raw_data: bool = False) -> str:
         return create_formatted_response(raw_data, summary, formatted_entries, include_raw_data)
         
     except Exception as e:
-        return json.dumps({
+        return json_utils.dumps({
             "error": f"Failed to format games response: {str(e)}",
             "raw_data": raw_data if include_raw_data else None
-        }, indent=2)
+        }, pretty=True)
 
 
-def format_betting_response(raw_data: str, include_raw_data: bool = False) -> str:
+def format_betting_response(raw_data: Union[str, Dict[str, Any]], include_raw_data: bool = False) -> str:
     """
     Format betting lines response into human-readable summary.
     
@@ -255,7 +278,7 @@ def format_betting_response(raw_data: str, include_raw_data: bool = False) -> st
         Formatted JSON response
     """
     try:
-        data = json.loads(raw_data)
+        data = parse_raw_data(raw_data)
         
         # Check if betting summary exists (from calculate_records=true)
         if "betting_summary" in data:
@@ -429,10 +452,10 @@ def format_betting_response(raw_data: str, include_raw_data: bool = False) -> st
         return create_formatted_response(raw_data, summary, formatted_entries, include_raw_data)
         
     except Exception as e:
-        return json.dumps({
+        return json_utils.dumps({
             "error": f"Failed to format betting response: {str(e)}",
             "raw_data": raw_data if include_raw_data else None
-        }, indent=2)
+        }, pretty=True)
 
 
 def format_rankings_response(raw_data: str, include_raw_data: bool = False, context: dict = None) -> str:
@@ -448,7 +471,7 @@ def format_rankings_response(raw_data: str, include_raw_data: bool = False, cont
         Formatted YAML response optimized for single poll or team search
     """
     try:
-        data = json.loads(raw_data)
+        data = parse_raw_data(raw_data)
         polls = data.get("data", {}).get("poll", [])
         previous_week_data = data.get("previous_week_data", {})
         
@@ -609,10 +632,10 @@ def format_rankings_response(raw_data: str, include_raw_data: bool = False, cont
             return create_formatted_response(raw_data, summary, formatted_entries, include_raw_data)
         
     except Exception as e:
-        return json.dumps({
+        return json_utils.dumps({
             "error": f"Failed to format rankings response: {str(e)}",
             "raw_data": raw_data if include_raw_data else None
-        }, indent=2)
+        }, pretty=True)
 
 
 def format_athletes_response(raw_data: str, include_raw_data: bool = False) -> str:
@@ -627,7 +650,7 @@ def format_athletes_response(raw_data: str, include_raw_data: bool = False) -> s
         Formatted JSON response
     """
     try:
-        data = json.loads(raw_data)
+        data = parse_raw_data(raw_data)
         athletes = data.get("data", {}).get("athlete", [])
         
         # Create summary
@@ -678,13 +701,13 @@ def format_athletes_response(raw_data: str, include_raw_data: bool = False) -> s
         return create_formatted_response(raw_data, summary, formatted_entries, include_raw_data)
         
     except Exception as e:
-        return json.dumps({
+        return json_utils.dumps({
             "error": f"Failed to format athletes response: {str(e)}",
             "raw_data": raw_data if include_raw_data else None
-        }, indent=2)
+        }, pretty=True)
 
 
-def format_depth_chart_response(raw_data: str, include_raw_data: bool = False, context: dict = None) -> str:
+def format_depth_chart_response(raw_data: Union[str, Dict[str, Any]], include_raw_data: bool = False, context: dict = None) -> str:
     """
     Format depth chart response into organized team depth chart.
     
@@ -696,7 +719,7 @@ def format_depth_chart_response(raw_data: str, include_raw_data: bool = False, c
         Formatted YAML response with organized depth chart
     """
     try:
-        data = json.loads(raw_data)
+        data = parse_raw_data(raw_data)
         athletes = data.get("data", {}).get("athlete", [])
         
         if not athletes:
@@ -836,10 +859,10 @@ def format_depth_chart_response(raw_data: str, include_raw_data: bool = False, c
         return create_formatted_response(raw_data, summary, depth_chart, include_raw_data)
         
     except Exception as e:
-        return json.dumps({
+        return json_utils.dumps({
             "error": f"Failed to format depth chart response: {str(e)}",
             "raw_data": raw_data if include_raw_data else None
-        }, indent=2)
+        }, pretty=True)
 
 
 def format_metrics_response(raw_data: str, include_raw_data: bool = False) -> str:
@@ -854,7 +877,7 @@ def format_metrics_response(raw_data: str, include_raw_data: bool = False) -> st
         Formatted JSON response
     """
     try:
-        data = json.loads(raw_data)
+        data = parse_raw_data(raw_data)
         
         # This is a generic formatter since metrics structure may vary
         # Extract top-level data arrays
@@ -883,10 +906,10 @@ def format_metrics_response(raw_data: str, include_raw_data: bool = False) -> st
         return create_formatted_response(raw_data, summary, formatted_entries, include_raw_data)
         
     except Exception as e:
-        return json.dumps({
+        return json_utils.dumps({
             "error": f"Failed to format metrics response: {str(e)}",
             "raw_data": raw_data if include_raw_data else None
-        }, indent=2)
+        }, pretty=True)
 
 
 def format_team_ratings_response(raw_data: str, include_raw_data: bool = False) -> str:
@@ -901,7 +924,7 @@ def format_team_ratings_response(raw_data: str, include_raw_data: bool = False)
         Formatted YAML response with intelligent ratings analysis
     """
     try:
-        data = json.loads(raw_data)
+        data = parse_raw_data(raw_data)
         team_data = data.get("data", {}).get("team_ratings", {})
         
         ratings = team_data.get("ratings", [])
@@ -991,13 +1014,13 @@ def format_team_ratings_response(raw_data: str, include_raw_data: bool = False)
         return create_formatted_response(raw_data, summary, formatted_entries, include_raw_data)
         
     except Exception as e:
-        return json.dumps({
+        return json_utils.dumps({
             "error": f"Failed to format team ratings response: {str(e)}",
-            "raw_data": json.loads(raw_data) if raw_data else None
-        }, indent=2)
+            "raw_data": parse_raw_data(raw_data) if raw_data else None
+        }, pretty=True)
 
 
-def format_generic_graphql_response(raw_data: str, include_raw_data: bool = False) -> str:
+def format_generic_graphql_response(raw_data: Union[str, Dict[str, Any]], include_raw_data: bool = False) -> str:
     """
     Format generic GraphQL response into human-readable summary.
     
@@ -1009,7 +1032,7 @@ def format_generic_graphql_response(raw_data: str, include_raw_data: bool = Fals
         Formatted YAML response
     """
     try:
-        data = json.loads(raw_data)
+        data = parse_raw_data(raw_data)
         
         # Handle GraphQL response structure
         graphql_data = data.get("data", {})
@@ -1076,14 +1099,14 @@ def format_generic_graphql_response(raw_data: str, include_raw_data: bool = Fals
         return create_formatted_response(raw_data, summary, formatted_entries, include_raw_data)
         
     except Exception as e:
-        return json.dumps({
+        return json_utils.dumps({
             "error": f"Failed to format generic GraphQL response: {str(e)}",
             "raw_data": raw_data if include_raw_data else None
-        }, indent=2)
+        }, pretty=True)
 
 
 def safe_format_response(
-    raw_data: str, 
+    raw_data: Union[str, Dict[str, Any]], 
     response_type: str, 
     include_raw_data: bool = False,
     context: dict = None
@@ -1093,7 +1116,7 @@ def safe_format_response(
     Always returns YAML format for optimal token efficiency.
     
     Args:
-        raw_data: Raw JSON response
+        raw_data: Raw JSON response (string or already-parsed dict)
         response_type: Type of response (teams, games, betting, rankings, athletes, metrics, generic)
         include_raw_data: Whether to include raw data
         context: Additional context for formatting
@@ -1126,10 +1149,10 @@ def safe_format_response(
                 return format_generic_graphql_response(raw_data, include_raw_data)
             except Exception as fallback_e:
                 # Final fallback to raw data with error message
-                return json.dumps({
+                return json_utils.dumps({
                     "error": f"All formatting failed: {str(e)}, fallback error: {str(fallback_e)}",
-                    "raw_data": json.loads(raw_data) if raw_data else None
-                }, indent=2)
+                    "raw_data": parse_raw_data(raw_data) if raw_data else None
+                }, pretty=True)
     else:
         # Unknown response type, use generic formatter
         return format_generic_graphql_response(raw_data, include_raw_data)
\ No newline at end of file
@@ -2,21 +2,43 @@
 Team resolution utilities for NCAAF MCP tools.
 
 Provides simple, query-time resolution of team names/abbreviations to team IDs
-using the existing GraphQL infrastructure.
+using the existing GraphQL infrastructure, with exact names served from a
+periodically refreshed snapshot of all teams.
 """
 
-import json
+import asyncio
 import logging
-from typing import Optional
+import time
+from typing import Dict, Optional, Tuple
 
 # Import from dedicated module to avoid circular imports
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from src.graphql import precompute_query_encodings, validate_query_documents
 from src.graphql_executor import execute_graphql
+from utils.graphql_utils import minify_query
 
 logger = logging.getLogger(__name__)
 
+# Team name -> ID mappings are effectively static, so successful lookups are
+# cached by normalized identifier (strip + lowercase)
+_TEAM_ID_CACHE_TTL = 3600
+_TEAM_ID_CACHE_MAXSIZE = 512
+_team_id_cache: Dict[str, Tuple[float, int]] = {}
+
+# Snapshot of every team's lowercased school name and abbreviation -> ID,
+# loaded in the background so exact names resolve without a query
+_TEAM_INDEX_REFRESH_INTERVAL = 3600
+_team_index: Dict[str, int] = {}
+
+TEAM_INDEX_QUERY = """
+query GetTeamIndex {
+    currentTeams(orderBy: { school: ASC }) {
+        teamId
+        school
+        abbreviation
+    }
+}
+"""
+
 # GraphQL query for team resolution
 TEAM_RESOLUTION_QUERY = """
 query GetTeamByName($search: String!) {
@@ -38,6 +60,15 @@ query GetTeamByName($search: String!) {
 }
 """
 
+# Sent minified, with request encodings and APQ hashes computed (and the
+# documents optionally validated) once at import
+TEAM_INDEX_QUERY = minify_query(TEAM_INDEX_QUERY)
+TEAM_RESOLUTION_QUERY = minify_query(TEAM_RESOLUTION_QUERY)
+_TEAM_RESOLVER_QUERIES = (TEAM_INDEX_QUERY, TEAM_RESOLUTION_QUERY)
+
+precompute_query_encodings(_TEAM_RESOLVER_QUERIES)
+validate_query_documents(_TEAM_RESOLVER_QUERIES)
+
 
 async def resolve_team_id(team_identifier: str) -> int:
     """
@@ -80,14 +111,20 @@ async def resolve_team_id(team_identifier: str) -> int:
             raise ValueError(f"Invalid team ID: {team_id}")
         return team_id
     
+    cache_key = team_identifier.lower()
+    team_id = _team_index.get(cache_key)
+    if team_id is not None:
+        return team_id
+    
+    cached = _team_id_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _TEAM_ID_CACHE_TTL:
+        return cached[1]
+    
     # Search for team by name/abbreviation using GraphQL
     try:
         search_pattern = f"%{team_identifier}%"
-        result = await execute_graphql(TEAM_RESOLUTION_QUERY, {"search": search_pattern})
-        
-        # Parse the result
-        result_data = json.loads(result)
-        teams = result_data.get('data', {}).get('currentTeams', [])
+        result = await execute_graphql(TEAM_RESOLUTION_QUERY, {"search": search_pattern}, return_raw_dict=True)
+        teams = (result.get('data') or {}).get('currentTeams') or []
         
         if not teams:
             raise ValueError(f"No teams found matching '{team_identifier}'")
@@ -106,14 +143,50 @@ async def resolve_team_id(team_identifier: str) -> int:
         best_match = exact_matches[0] if exact_matches else teams[0]
         
         logger.info(f"Resolved '{team_identifier}' to {best_match['school']} (ID: {best_match['teamId']})")
+        
+        if len(_team_id_cache) >= _TEAM_ID_CACHE_MAXSIZE:
+            _team_id_cache.clear()
+        _team_id_cache[cache_key] = (time.monotonic(), best_match['teamId'])
+        
         return best_match['teamId']
         
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Failed to parse team search results: {str(e)}")
     except Exception as e:
         raise ValueError(f"Failed to resolve team '{team_identifier}': {str(e)}")
 
 
+async def load_team_index() -> None:
+    """
+    Fetch all teams and replace the exact-name snapshot used by resolve_team_id.
+    
+    School names take precedence over abbreviations when the two collide.
+    """
+    global _team_index
+    result = await execute_graphql(TEAM_INDEX_QUERY, return_raw_dict=True)
+    teams = (result.get('data') or {}).get('currentTeams') or []
+    
+    index: Dict[str, int] = {}
+    for team in teams:
+        if team.get('school'):
+            index.setdefault(team['school'].lower(), team['teamId'])
+    for team in teams:
+        if team.get('abbreviation'):
+            index.setdefault(team['abbreviation'].lower(), team['teamId'])
+    
+    _team_index = index
+    logger.info(f"Loaded team index with {len(teams)} teams")
+
+
+async def keep_team_index_fresh() -> None:
+    """Load the team index, then reload it every _TEAM_INDEX_REFRESH_INTERVAL seconds."""
+    while True:
+        try:
+            await load_team_index()
+        except Exception as e:
+            # Lookups fall back to per-name queries until the next attempt
+            logger.warning(f"Failed to load team index: {e}")
+        await asyncio.sleep(_TEAM_INDEX_REFRESH_INTERVAL)
+
+
 async def resolve_optional_team_id(team_identifier: Optional[str]) -> Optional[int]:
     """
     Resolve team identifier to ID, handling None values.
@@ -5,11 +5,12 @@ Functions to calculate team performance metrics, home/away splits,
 conference records, streak analysis, and season summaries.
 """
 
-import json
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from statistics import mean
 from datetime import datetime
 
+from utils import json_utils
+
 
 def calculate_team_performance_splits(games: List[Dict[str, Any]], team_name: str) -> Dict[str, Any]:
     """
@@ -312,19 +313,19 @@ def calculate_season_summary(games: List[Dict[str, Any]], team_name: str, team_i
     }
 
 
-def calculate_team_performance_from_graphql(graphql_result: str, team_id: int = None) -> Dict[str, Any]:
+def calculate_team_performance_from_graphql(graphql_result: Union[str, Dict[str, Any]], team_id: int = None) -> Dict[str, Any]:
     """
-    Calculate team performance analysis from a GraphQL response string.
+    Calculate team performance analysis from a GraphQL response.
     
     Args:
-        graphql_result: JSON string from GraphQL team games query
+        graphql_result: GraphQL team games query response (JSON string or parsed dict)
         team_id: Team ID to analyze (for team name lookup)
         
     Returns:
         Dictionary with team performance analysis or None if insufficient data
     """
     try:
-        data = json.loads(graphql_result)
+        data = graphql_result if isinstance(graphql_result, dict) else json_utils.loads(graphql_result)
         games = data.get('data', {}).get('game', [])
         
         if not games: